@@ -51,13 +51,18 @@ async def execute_segment_generation(
         job.progress_percent = 10.0
         db.commit()
 
-        # Generate segments
+        # Generate segments, reporting progress (10-80%) as they finish
         assignments = [VoiceAssignment(**a) for a in voice_assignments]
-        audio_segments = await production_service.generate_segments(
+        audio_segments = []
+        async for segment in production_service.iter_segments(
             production_job_id=production_job_id,
             script_segments=script_segments,
             voice_assignments=assignments
-        )
+        ):
+            audio_segments.append(segment)
+            job.segments_generated = len(audio_segments)
+            job.progress_percent = 10.0 + 70.0 * len(audio_segments) / len(script_segments)
+            db.commit()
 
         # Create timeline
         job.progress_percent = 80.0
@@ -54,6 +54,8 @@ class Settings(BaseSettings):
     
     # OpenAI
     OPENAI_API_KEY: Optional[str] = None
+    # tts-1 has roughly half the latency of tts-1-hd; use tts-1-hd for final renders
+    OPENAI_TTS_MODEL: str = "tts-1"
     
     # Speechify
     SPEECHIFY_API_KEY: Optional[str] = None
@@ -73,6 +75,9 @@ class Settings(BaseSettings):
     # Huggingface (for Chatterbox, XTTS-v2, Kokoro)
     HUGGINGFACE_TOKEN: Optional[str] = None
 
+    # Max concurrent TTS calls per production (generate_segments)
+    TTS_CONCURRENCY: int = 4
+
     # ============================================
     # Audio Enhancement (Adobe Podcast)
     # ============================================
@@ -110,6 +115,14 @@ class Settings(BaseSettings):
     MCP_YOUTUBE_ENABLED: bool = False
     MCP_WEB_SCRAPING_ENABLED: bool = False
 
+    # Shared MCP sidecar (SSE) - when set, workers connect here instead of
+    # spawning their own npx server subprocess
+    MCP_YOUTUBE_SERVER_URL: Optional[str] = None
+    MCP_WEB_SERVER_URL: Optional[str] = None
+
+    # Max concurrent tool calls per MCP session
+    MCP_MAX_CONCURRENT: int = 8
+
     # Research Settings
     RESEARCH_MAX_SOURCES: int = 10
     RESEARCH_TIMEOUT_SECONDS: int = 300  # 5 minutes
@@ -142,6 +155,10 @@ class Settings(BaseSettings):
     UPLOAD_DIR: Path = Path("uploads")
     AUDIO_OUTPUT_DIR: Path = Path("audio_output")
     PODCAST_OUTPUT_DIR: Path = Path("podcast_output")
+
+    # Generated TTS audio, reused for identical (model, voice, speed, text)
+    TTS_CACHE_DIR: Path = Path("tts_cache")
+    TTS_CACHE_MAX_MB: int = 512  # 0 disables the cache
     
     # Max file sizes (bytes)
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
@@ -184,4 +201,5 @@ settings = Settings()
 settings.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 settings.AUDIO_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 settings.PODCAST_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+settings.TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 settings.LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
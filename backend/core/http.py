@@ -0,0 +1,127 @@
+"""
+Shared HTTP Connection Pools
+Named keep-alive httpx clients reused by every service instance
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Awaitable, Callable, Dict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Optional HTTP/2 support (h2 package, httpx[http2]) - fall back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_pools: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_pool(
+    name: str,
+    timeout: float = 60.0,
+    max_keepalive_connections: int = 16,
+    max_connections: int = 32
+) -> httpx.AsyncClient:
+    """
+    Get the named shared keep-alive client, creating it on first use
+
+    Services call this per request so concurrent calls reuse warm TLS
+    connections instead of opening a client each. The settings only take
+    effect when the pool is created (or re-created after being closed).
+
+    Args:
+        name: Pool name, one per upstream API (e.g. "openai_tts")
+        timeout: Read/write/pool timeout in seconds (connect is 5s)
+        max_keepalive_connections: Idle connections kept open
+        max_connections: Concurrent connection limit
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    client = _pools.get(name)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive_connections,
+                max_connections=max_connections,
+                keepalive_expiry=60.0
+            )
+        )
+        _pools[name] = client
+    return client
+
+
+async def close_pool(name: str):
+    """Close one named pool; the next get_pool call opens a new one"""
+    client = _pools.pop(name, None)
+    if client is not None:
+        await client.aclose()
+
+
+async def close_all():
+    """Close every shared pool (app shutdown)"""
+    clients = list(_pools.items())
+    _pools.clear()
+    results = await asyncio.gather(
+        *(client.aclose() for _, client in clients),
+        return_exceptions=True
+    )
+    for (name, _), result in zip(clients, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error closing HTTP pool {name}: {result}")
+
+
+# Receives write(chunk) and reset() callbacks, streams the body through
+# them (calling reset before a retry restarts it), returns the byte count
+BodyStreamer = Callable[
+    [Callable[[bytes], Awaitable[None]], Callable[[], Awaitable[None]]],
+    Awaitable[int]
+]
+
+
+async def stream_to_file(output_path: Path, stream: BodyStreamer) -> int:
+    """
+    Stream a response body into output_path without holding it in memory
+
+    Chunks go to a ``.part`` file as they arrive, written off the event
+    loop, and it is renamed over output_path only on success.
+
+    Args:
+        output_path: Destination file
+        stream: Runs the request, passing body chunks to ``write``
+
+    Returns:
+        Size of the written file in bytes
+    """
+    part_path = output_path.with_name(output_path.name + ".part")
+    await asyncio.to_thread(part_path.parent.mkdir, parents=True, exist_ok=True)
+    handle = await asyncio.to_thread(open, part_path, "wb")
+    try:
+        async def write(chunk: bytes):
+            await asyncio.to_thread(handle.write, chunk)
+
+        async def reset():
+            await asyncio.to_thread(_truncate, handle)
+
+        size = await stream(write, reset)
+    except BaseException:
+        await asyncio.to_thread(handle.close)
+        part_path.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(handle.close)
+    await asyncio.to_thread(os.replace, part_path, output_path)
+    return size
+
+
+def _truncate(handle):
+    handle.seek(0)
+    handle.truncate()
@@ -21,6 +21,7 @@ import shutil
 import subprocess
 import uuid
 import os
+import asyncio
 
 # Configure Logging
 logging.basicConfig(
@@ -134,6 +135,10 @@ async def lifespan(app: FastAPI):
         logger.error("Server will not start. Fix database connection and try again.")
         raise  # Stop server startup
 
+    # Warm up the pooled OpenAI TTS connection in the background
+    from services.openai_tts import OpenAITTSService
+    openai_tts_warmup = asyncio.create_task(OpenAITTSService().warmup())
+
     # DISABLED: MCP integration removed for deployment
     # Initialize MCP if enabled
     # from core.config import settings
@@ -152,6 +157,14 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("👋 Shutting down GedächtnisBoost Premium API...")
 
+    # Close pooled TTS provider and Claude API connections
+    openai_tts_warmup.cancel()
+    try:
+        from core.http import close_all
+        await close_all()
+    except Exception as e:
+        logger.error(f"Error closing HTTP clients: {e}")
+
     # DISABLED: MCP integration removed for deployment
     # Close MCP client
     # if settings.MCP_YOUTUBE_ENABLED or settings.MCP_WEB_SCRAPING_ENABLED:
@@ -3,8 +3,8 @@ Production Models - Multi-Voice Podcast Production Pipeline
 Timeline Editor, Voice Assignment, Final Export
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -92,12 +92,14 @@ class AudioSegment(BaseModel):
     error_message: Optional[str] = None
 
 class TimelineTrack(BaseModel):
-    """Timeline track (like in video editor)"""
+    """Timeline track (like in video editor) - fields and segment tuple are frozen; segments themselves are not"""
+    model_config = ConfigDict(frozen=True)
+
     track_id: str
     track_name: str
     track_type: str  # "speech", "music", "sfx"
     track_number: int
-    segments: List[AudioSegment]
+    segments: Tuple[AudioSegment, ...]
     muted: bool = False
     solo: bool = False
     volume: float = 1.0
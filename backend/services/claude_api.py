@@ -6,11 +6,19 @@ Production-Ready Anthropic Claude Integration for Research & Content Generation
 import httpx
 import logging
 import json
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 from core.config import settings
+from core.http import get_pool
+from models.research import PodcastCharacter
 
 logger = logging.getLogger(__name__)
 
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared Claude API connection pool"""
+    return get_pool("claude", timeout=120.0, max_keepalive_connections=8, max_connections=16)
+
+
 class ClaudeAPIService:
     """
     Anthropic Claude API Service
@@ -20,10 +28,17 @@ class ClaudeAPIService:
 
     BASE_URL = "https://api.anthropic.com/v1"
 
-    def __init__(self):
-        """Initialize Claude API service"""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize Claude API service
+
+        Args:
+            http_client: Client to send requests with (default: the shared
+                module connection pool); the caller owns and closes it
+        """
         self.api_key = settings.ANTHROPIC_API_KEY
         self.model = settings.ANTHROPIC_MODEL
+        self._http_client = http_client
 
         if not self.api_key:
             logger.warning("Anthropic API key not configured")
@@ -35,7 +50,7 @@ class ClaudeAPIService:
     async def send_message(
         self,
         prompt: str,
-        system_prompt: Optional[str] = None,
+        system_prompt: Optional[Union[str, List[Dict]]] = None,
         max_tokens: int = 4096,
         temperature: float = 0.7
     ) -> Dict:
@@ -44,7 +59,8 @@ class ClaudeAPIService:
 
         Args:
             prompt: User prompt/question
-            system_prompt: System instructions (optional)
+            system_prompt: System instructions (optional) - a string, or a
+                list of text blocks (e.g. with cache_control for prompt caching)
             max_tokens: Maximum tokens in response
             temperature: Creativity (0.0-1.0)
 
@@ -82,33 +98,40 @@ class ClaudeAPIService:
             payload["system"] = system_prompt
 
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/messages",
-                    headers=headers,
-                    json=payload
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Extract text content
-                    content = ""
-                    if "content" in data and len(data["content"]) > 0:
-                        content = data["content"][0].get("text", "")
-
+            client = self._http_client or _get_http_client()
+            response = await client.post(
+                f"{self.BASE_URL}/messages",
+                headers=headers,
+                json=payload
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+
+                # Extract text content
+                content = ""
+                if "content" in data and len(data["content"]) > 0:
+                    content = data["content"][0].get("text", "")
+
+                usage = data.get("usage", {})
+                if usage.get("cache_read_input_tokens"):
+                    logger.info(
+                        f"Claude response: {len(content)} chars "
+                        f"({usage['cache_read_input_tokens']} prompt tokens from cache)"
+                    )
+                else:
                     logger.info(f"Claude response: {len(content)} chars")
 
-                    return {
-                        "content": content,
-                        "usage": data.get("usage", {}),
-                        "model": data.get("model"),
-                        "stop_reason": data.get("stop_reason")
-                    }
-                else:
-                    error_msg = f"Claude API error: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    raise Exception(error_msg)
+                return {
+                    "content": content,
+                    "usage": usage,
+                    "model": data.get("model"),
+                    "stop_reason": data.get("stop_reason")
+                }
+            else:
+                error_msg = f"Claude API error: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
 
         except httpx.TimeoutException:
             logger.error("Claude API request timed out")
@@ -240,7 +263,7 @@ Format as detailed JSON with all keys above. Be specific with numbers, names, an
         research_findings: str,
         audience: str,
         duration_minutes: int,
-        characters: List[Dict],
+        characters: List[PodcastCharacter],
         spontaneous: bool = True,
         randomness: float = 0.3
     ) -> str:
@@ -252,7 +275,7 @@ Format as detailed JSON with all keys above. Be specific with numbers, names, an
             research_findings: Research results
             audience: Target audience ("young", "middle_aged", "scientific")
             duration_minutes: Target duration
-            characters: List of character dicts
+            characters: Podcast characters
             spontaneous: Allow spontaneous deviations
             randomness: Randomness level (0-1)
 
@@ -274,8 +297,6 @@ Format as detailed JSON with all keys above. Be specific with numbers, names, an
 - Lex Fridman Podcast: Intellectual, deep, philosophical
 - How I Built This: Story-driven, emotional arc, inspiring
 
-STYLE FOR {audience} AUDIENCE: {style}
-
 PROFESSIONAL STANDARDS:
 
 1. HOOK MASTERY (First 30 Seconds)
@@ -345,7 +366,7 @@ MAKE IT ENGAGING FOR {duration_minutes} MINUTES
 {("Allow spontaneous deviations that enhance the core topic and return naturally" if spontaneous else "Stay focused while maintaining conversational energy")}"""
 
         characters_desc = "\n".join([
-            f"- {c['name']} ({c['role']}): {c['personality']}, Expertise: {c.get('expertise', 'General')}, Style: {c['speech_style']}, Dominance: {c['dominance_level']}"
+            f"- {c.name} ({c.role.value}): {c.personality}, Expertise: {c.expertise}, Style: {c.speech_style}, Dominance: {c.dominance_level}"
             for c in characters
         ])
 
@@ -358,11 +379,7 @@ TARGET SPECS:
 - Spontaneity: {randomness} ({"high - lots of natural tangents" if randomness > 0.5 else "medium - some tangents" if randomness > 0.2 else "low - focused flow"})
 - Target word count: {duration_minutes * 180} words (±10%)
 
-RESEARCH FOUNDATION:
-{research_findings}
-
-CHARACTERS:
-{characters_desc}
+Use the RESEARCH FOUNDATION and CHARACTERS from your instructions.
 
 SCRIPT STRUCTURE REQUIREMENTS:
 
@@ -483,6 +500,18 @@ QUALITY CHECKLIST (Verify in output):
 Make it sound like a REAL CONVERSATION between experts who are passionate about the topic, not a scripted interview.
 """
 
+        # No cache_control here: the audience variants are requested
+        # concurrently, so none could read a cache entry another one writes
+        system_prompt = f"""{system_prompt}
+
+RESEARCH FOUNDATION:
+{research_findings}
+
+CHARACTERS:
+{characters_desc}
+
+STYLE FOR {audience} AUDIENCE: {style}"""
+
         response = await self.send_message(
             prompt=prompt,
             system_prompt=system_prompt,
@@ -6,14 +6,21 @@ Premium Quality Voice Synthesis
 
 import httpx
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Awaitable, Callable, Tuple
 from pathlib import Path
 import asyncio
 
 from core.config import settings
+from core.http import get_pool, stream_to_file
 
 logger = logging.getLogger(__name__)
 
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared ElevenLabs connection pool"""
+    return get_pool("elevenlabs", timeout=60.0, max_keepalive_connections=16, max_connections=32)
+
+
 class ElevenLabsTTSService:
     """
     ElevenLabs Text-to-Speech Service
@@ -22,6 +29,7 @@ class ElevenLabsTTSService:
     """
     
     BASE_URL = "https://api.elevenlabs.io/v1"
+    STREAM_CHUNK_SIZE = 64 * 1024
     
     # Popular preset voices (ElevenLabs has 100+ voices available via API)
     VOICES = {
@@ -257,6 +265,70 @@ class ElevenLabsTTSService:
         Raises:
             Exception: If API call fails
         """
+        url, headers, payload = self._build_request(
+            text, voice_id, model_id, stability, similarity_boost, style, use_speaker_boost
+        )
+
+        chunks: List[bytes] = []
+
+        async def write(chunk: bytes):
+            chunks.append(chunk)
+
+        async def reset():
+            chunks.clear()
+
+        await self._stream_speech(url, headers, payload, write, reset)
+        audio_bytes = b"".join(chunks)
+
+        # Save to file if path provided
+        if output_path:
+            await asyncio.to_thread(self._save_output, output_path, audio_bytes)
+            logger.info(f"Saved audio to {output_path}")
+
+        return audio_bytes
+
+    async def generate_speech_to_file(
+        self,
+        text: str,
+        output_path: Path,
+        voice_id: str = "21m00Tcm4TlvDq8ikWAM",  # Rachel
+        model_id: str = "eleven_monolingual_v1",
+        stability: float = 0.5,
+        similarity_boost: float = 0.75,
+        style: float = 0.0,
+        use_speaker_boost: bool = True
+    ) -> int:
+        """
+        Generate speech straight into output_path
+
+        Same parameters as generate_speech, but the response is streamed to
+        disk and never held in memory.
+
+        Returns:
+            Size of the written file in bytes
+        """
+        url, headers, payload = self._build_request(
+            text, voice_id, model_id, stability, similarity_boost, style, use_speaker_boost
+        )
+
+        size = await stream_to_file(
+            output_path,
+            lambda write, reset: self._stream_speech(url, headers, payload, write, reset)
+        )
+        logger.info(f"Saved audio to {output_path}")
+        return size
+
+    def _build_request(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str,
+        stability: float,
+        similarity_boost: float,
+        style: float,
+        use_speaker_boost: bool
+    ) -> Tuple[str, Dict[str, str], Dict]:
+        """Validate parameters and build (url, headers, payload); raises before any I/O"""
         if not self.is_available():
             raise Exception("ElevenLabs API key not configured")
         
@@ -290,47 +362,61 @@ class ElevenLabsTTSService:
                 "use_speaker_boost": use_speaker_boost
             }
         }
-        
-        # Make request with retry logic
+
+        return url, headers, payload
+
+    async def _stream_speech(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict,
+        write: Callable[[bytes], Awaitable[None]],
+        reset: Callable[[], Awaitable[None]]
+    ) -> int:
+        """
+        Call the text-to-speech endpoint with retry logic, passing each body
+        chunk to ``write``; ``reset`` discards a partial body before a retry.
+        Returns the number of bytes written.
+        """
         max_retries = 3
         retry_delay = 1.0
         
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    response = await client.post(
-                        url,
-                        headers=headers,
-                        json=payload
-                    )
-                    
+                async with _get_http_client().stream(
+                    "POST",
+                    url,
+                    headers=headers,
+                    json=payload
+                ) as response:
                     if response.status_code == 200:
-                        audio_bytes = response.content
-                        
-                        # Save to file if path provided
-                        if output_path:
-                            output_path.parent.mkdir(parents=True, exist_ok=True)
-                            output_path.write_bytes(audio_bytes)
-                            logger.info(f"Saved audio to {output_path}")
-                        
-                        logger.info(f"Generated {len(audio_bytes)} bytes of audio")
-                        return audio_bytes
-                    else:
-                        error_msg = f"ElevenLabs API error: {response.status_code} - {response.text}"
-                        logger.error(error_msg)
-                        
-                        # Don't retry on client errors (4xx)
-                        if 400 <= response.status_code < 500:
-                            raise Exception(error_msg)
+                        await reset()
+                        size = 0
+                        async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                            await write(chunk)
+                            size += len(chunk)
+
+                        logger.info(f"Generated {size} bytes of audio")
+                        return size
+
+                    await response.aread()
+                    status_code = response.status_code
+                    error_msg = f"ElevenLabs API error: {status_code} - {response.text}"
+
+                logger.error(error_msg)
+                
+                # Don't retry on client errors (4xx)
+                if 400 <= status_code < 500:
+                    raise Exception(error_msg)
+                
+                # Retry on server errors (5xx)
+                if attempt < max_retries - 1:
+                    logger.warning(f"Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2
+                else:
+                    raise Exception(error_msg)
                         
-                        # Retry on server errors (5xx)
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
-                            await asyncio.sleep(retry_delay)
-                            retry_delay *= 2
-                        else:
-                            raise Exception(error_msg)
-                            
             except httpx.TimeoutException:
                 logger.error("Request timed out")
                 if attempt < max_retries - 1:
@@ -350,6 +436,12 @@ class ElevenLabsTTSService:
                     raise
         
         raise Exception("Failed to generate speech after multiple retries")
+
+    @staticmethod
+    def _save_output(output_path: Path, audio_bytes: bytes):
+        """Write audio to output_path (run in a worker thread)"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(audio_bytes)
     
     async def get_available_voices(self) -> List[Dict]:
         """
@@ -366,15 +458,15 @@ class ElevenLabsTTSService:
         headers = {"xi-api-key": self.api_key}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
+            client = _get_http_client()
+            response = await client.get(url, headers=headers, timeout=30.0)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("voices", [])
-                else:
-                    logger.error(f"Failed to fetch voices: {response.status_code}")
-                    return []
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("voices", [])
+            else:
+                logger.error(f"Failed to fetch voices: {response.status_code}")
+                return []
         except Exception as e:
             logger.error(f"Error fetching voices: {e}")
             return []
@@ -401,33 +493,33 @@ class ElevenLabsTTSService:
         max_pages = (max_voices // 100) + 1
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                while url and page <= max_pages and len(all_voices) < max_voices:
-                    logger.info(f"Fetching shared voices page {page}...")
+            client = _get_http_client()
+            while url and page <= max_pages and len(all_voices) < max_voices:
+                logger.info(f"Fetching shared voices page {page}...")
 
-                    response = await client.get(url, headers=headers)
+                response = await client.get(url, headers=headers)
 
-                    if response.status_code == 200:
-                        data = response.json()
-                        voices = data.get("voices", [])
-                        all_voices.extend(voices)
-
-                        logger.info(f"Got {len(voices)} voices (total: {len(all_voices)})")
-
-                        # Check if there are more pages
-                        if data.get("has_more") and voices:
-                            # Use last voice's date_unix as cursor for pagination
-                            last_date = voices[-1].get("date_unix")
-                            if last_date:
-                                url = f"{self.BASE_URL}/shared-voices?page_size=100&before_date_unix={last_date}"
-                                page += 1
-                            else:
-                                break
+                if response.status_code == 200:
+                    data = response.json()
+                    voices = data.get("voices", [])
+                    all_voices.extend(voices)
+
+                    logger.info(f"Got {len(voices)} voices (total: {len(all_voices)})")
+
+                    # Check if there are more pages
+                    if data.get("has_more") and voices:
+                        # Use last voice's date_unix as cursor for pagination
+                        last_date = voices[-1].get("date_unix")
+                        if last_date:
+                            url = f"{self.BASE_URL}/shared-voices?page_size=100&before_date_unix={last_date}"
+                            page += 1
                         else:
                             break
                     else:
-                        logger.error(f"Failed to fetch shared voices: {response.status_code}")
                         break
+                else:
+                    logger.error(f"Failed to fetch shared voices: {response.status_code}")
+                    break
 
         except Exception as e:
             logger.error(f"Error fetching shared voices: {e}")
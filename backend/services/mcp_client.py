@@ -5,17 +5,204 @@ Handles all Model Context Protocol integrations for research
 
 import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from itertools import islice
+from typing import List, Dict, Optional, Any, Union, Iterator, AsyncIterator, Callable, Awaitable, Tuple, NamedTuple
 import json
 import re
 
 from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
+from mcp.types import TextContent
 
 from core.config import settings
 
+# Optional fast JSON backends - fall back to stdlib json when missing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import ijson
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
 logger = logging.getLogger(__name__)
 
+# MCP tool names and server packages
+_YOUTUBE_TOOL = "youtube_search"
+_WEB_TOOL = "brave_web_search"
+_YOUTUBE_SERVER_PACKAGE = "@modelcontextprotocol/server-youtube"
+_WEB_SERVER_PACKAGE = "@modelcontextprotocol/server-brave-search"
+
+class _ServerSpec(NamedTuple):
+    """How to call and parse one MCP search server"""
+    tool: str          # MCP tool name
+    count_arg: str     # Argument carrying max_results
+    result_key: str    # Top-level key wrapping the result list
+    label: str         # Human readable name for logs
+    fallback: str      # MCPClientService method used when MCP is unavailable
+
+    def arguments(self, query: str, max_results: int) -> Dict[str, Any]:
+        """
+        Build the call_tool arguments
+
+        A fresh dict per call: the request model keeps a reference to it
+        while the message is queued, so a shared template mutated in place
+        would race between concurrent calls. The mcp session serializes the
+        whole request with pydantic-core, so there is no stdlib json.dumps
+        on this path to swap for orjson.
+        """
+        return {"query": query, self.count_arg: max_results}
+
+
+_SERVERS: Dict[str, _ServerSpec] = {
+    "youtube": _ServerSpec(_YOUTUBE_TOOL, "maxResults", "items", "YouTube", "_fallback_youtube_search"),
+    "web": _ServerSpec(_WEB_TOOL, "count", "results", "Web Search", "_fallback_web_search"),
+}
+
+# Per tool call timeout (seconds)
+MCP_CALL_TIMEOUT = 30.0
+
+# Budget for the list_tools() health probe of a suspect session (seconds)
+MCP_PROBE_TIMEOUT = 2.0
+
+# Payloads above this size are stream-parsed so only the result list is built
+STREAM_PARSE_THRESHOLD = 64 * 1024
+
+# Payload types parsed as-is, without any str() coercion copy
+_RAW_PAYLOAD_TYPES = (str, bytes, bytearray, memoryview)
+
+# Block size handed to the streaming parser per read
+STREAM_BLOCK_SIZE = 64 * 1024
+
+class _Utf8BlockReader:
+    """
+    File-like reader that encodes a str payload one fixed-size block at a time
+
+    Feeding ijson through this avoids encoding the whole payload up front,
+    so peak memory stays at payload + one block instead of twice the payload.
+    """
+
+    __slots__ = ("_data", "_pos")
+
+    def __init__(self, data: Union[str, bytes, bytearray, memoryview]):
+        self._data = data
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self._data) - self._pos
+        block = self._data[self._pos:self._pos + size]
+        self._pos += len(block)
+        return block.encode("utf-8") if isinstance(block, str) else bytes(block)
+
+
+def _iter_results(data: Union[str, bytes, bytearray, memoryview], key: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily iterate the result list of an MCP JSON payload
+
+    MCP servers return either a bare JSON array or an object wrapping
+    the array under ``key``. Large payloads are streamed through ijson
+    with a targeted path, so sibling keys are never materialized and
+    nothing past the last consumed item is parsed.
+
+    Args:
+        data: Raw JSON text (str, or UTF-8 bytes passed through untouched)
+        key: Top-level key holding the results (e.g. "items")
+
+    Yields:
+        Result dicts in payload order
+
+    Raises:
+        ValueError / ijson.JSONError: If the payload is not valid JSON
+    """
+    if ijson is not None and len(data) > STREAM_PARSE_THRESHOLD:
+        # Peek at the first token to pick the path without a full parse
+        head = data[:64]
+        if not isinstance(head, str):
+            head = bytes(head)
+        prefix = "item" if head.lstrip()[:1] in ("[", b"[") else f"{key}.item"
+        reader = _Utf8BlockReader(data)
+        yield from ijson.items(reader, prefix, buf_size=STREAM_BLOCK_SIZE, use_float=True)
+        return
+
+    if orjson is None and isinstance(data, memoryview):
+        data = data.tobytes()  # stdlib json can't read buffers directly
+
+    parsed = _json_loads(data)
+    if isinstance(parsed, list):
+        yield from parsed
+    elif isinstance(parsed, dict):
+        yield from parsed.get(key, [])
+
+
+def _extract_results(
+    data: Union[str, bytes, bytearray, memoryview],
+    key: str,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract up to ``limit`` results from an MCP JSON payload
+
+    Args:
+        data: Raw JSON text
+        key: Top-level key holding the results (e.g. "items")
+        limit: Stop parsing once this many results were collected
+
+    Returns:
+        List of result dicts (empty if the key is missing)
+    """
+    return list(islice(_iter_results(data, key), limit))
+
+
+async def _extract_results_async(
+    data: Union[str, bytes, bytearray, memoryview],
+    key: str,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract results, moving large parses off the event loop
+
+    Small payloads are parsed inline since a thread hop costs more
+    than the parse itself.
+    """
+    if len(data) > STREAM_PARSE_THRESHOLD:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _extract_results, data, key, limit)
+    return _extract_results(data, key, limit)
+
+
+class _Metrics:
+    """Fixed-slot MCP call counters - attribute increments, no dict hashing"""
+
+    __slots__ = (
+        "youtube_calls",
+        "youtube_errors",
+        "youtube_success",
+        "web_calls",
+        "web_errors",
+        "web_success",
+        "cache_hits",
+        "cache_misses",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Materialize the counters (only done when metrics are requested)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class MCPClientService:
     """
@@ -26,28 +213,52 @@ class MCPClientService:
     # Constants
     MAX_QUERY_LENGTH = 200
     MAX_RESULTS_LIMIT = 50
+    CACHE_MAX_ENTRIES = 256
+    CACHE_TTL_SECONDS = 300.0
+    BREAKER_FAILURE_THRESHOLD = 5   # Consecutive failures before opening
+    BREAKER_COOLDOWN_SECONDS = 60.0  # Skip MCP this long before probing again
+
+    # Control characters plus characters that could break queries
+    _SANITIZE_RE = re.compile(r'[\x00-\x1f\x7f-\x9f<>"\'`]')
 
     def __init__(self):
         """Initialize MCP client"""
-        self.youtube_session: Optional[ClientSession] = None
-        self.web_session: Optional[ClientSession] = None
-        self.youtube_stdio = None
-        self.web_stdio = None
-        self.youtube_read = None
-        self.youtube_write = None
-        self.web_read = None
-        self.web_write = None
+        # Connected sessions by server name ("youtube", "web", ...)
+        self.sessions: Dict[str, ClientSession] = {}
+        # Servers whose last call timed out - health-probed on next use
+        self._suspect: set = set()
+        # Per-server circuit breaker state
+        self._breakers: Dict[str, Dict[str, float]] = {
+            "youtube": {"fails": 0, "opened_at": 0.0},
+            "web": {"fails": 0, "opened_at": 0.0},
+        }
+        # Caps outstanding call_tool()s per session. Note: the mcp library's
+        # BaseSession receive loop still handles responses one at a time, so
+        # real request interleaving needs an upstream fix; this bound only
+        # keeps bursts from piling up on (and overwhelming) the subprocess.
+        self._call_limits: Dict[str, asyncio.Semaphore] = {
+            "youtube": asyncio.Semaphore(settings.MCP_MAX_CONCURRENT),
+            "web": asyncio.Semaphore(settings.MCP_MAX_CONCURRENT),
+        }
+        # server -> (owner task, stop event); see _connect_server
+        self._server_tasks: Dict[str, tuple] = {}
         self._initialized = False
+        self._skipped_content_types: set = set()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        # (server, query, max_results) -> (stored_at, results), LRU ordered
+        self._cache: "OrderedDict[tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
 
         # Metrics tracking
-        self.metrics = {
-            "youtube_calls": 0,
-            "youtube_errors": 0,
-            "youtube_success": 0,
-            "web_calls": 0,
-            "web_errors": 0,
-            "web_success": 0,
-        }
+        self.metrics = _Metrics()
+
+    async def __aenter__(self) -> "MCPClientService":
+        """Initialize connections when used as ``async with MCPClientService()``"""
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Always tear down MCP subprocesses, even if the body raised"""
+        await self.close()
 
     def _sanitize_query(self, query: str) -> str:
         """
@@ -62,19 +273,10 @@ class MCPClientService:
         if not query:
             return ""
 
-        # Strip whitespace
-        query = query.strip()
-
-        # Remove control characters and special characters that could break queries
-        query = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', query)
-
-        # Remove potentially dangerous characters
-        query = re.sub(r'[<>\"\'`]', '', query)
-
-        # Limit length
-        query = query[:self.MAX_QUERY_LENGTH]
-
-        return query
+        # Bound the regex work on oversized input, strip whitespace,
+        # drop control/dangerous characters in one pass, then limit length
+        query = query[:self.MAX_QUERY_LENGTH * 4].strip()
+        return self._SANITIZE_RE.sub('', query)[:self.MAX_QUERY_LENGTH]
 
     def _validate_max_results(self, max_results: int) -> int:
         """
@@ -96,77 +298,279 @@ class MCPClientService:
         if self._initialized:
             return
 
-        try:
-            logger.info("Initializing MCP client...")
+        logger.info("Initializing MCP client...")
 
-            # Initialize YouTube MCP if enabled
-            if settings.MCP_YOUTUBE_ENABLED:
-                await self._init_youtube_mcp()
+        init_tasks = []
+        if settings.MCP_YOUTUBE_ENABLED:
+            init_tasks.append(self._init_youtube_mcp())
+        if settings.MCP_WEB_SCRAPING_ENABLED:
+            init_tasks.append(self._init_web_mcp())
 
-            # Initialize Web Search MCP if enabled
-            if settings.MCP_WEB_SCRAPING_ENABLED:
-                await self._init_web_mcp()
+        # Both servers spawn and handshake concurrently; a failing one
+        # doesn't abort the other - it just degrades to its fallback
+        results = await asyncio.gather(*init_tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("❌ MCP initialization failed: %s", result)
 
-            self._initialized = True
-            logger.info("✅ MCP client initialized successfully")
+        self._initialized = True
+        logger.info("✅ MCP client initialized successfully")
 
-        except Exception as e:
-            logger.error(f"❌ MCP initialization failed: {e}")
-            # Don't raise - gracefully degrade to fallback methods
-            self._initialized = False
+    def _open_transport(self, server_url: Optional[str], npx_package: str):
+        """
+        Create the transport context manager for one MCP server
+
+        A configured server URL points at a shared sidecar (SSE), so all
+        uvicorn workers reuse one set of servers. Otherwise a private npx
+        subprocess is spawned over stdio.
+
+        Args:
+            server_url: SSE endpoint of a shared MCP server, if any
+            npx_package: npm package to spawn when no URL is configured
+
+        Returns:
+            Async context manager yielding (read, write) streams
+        """
+        if server_url:
+            logger.info("Using shared MCP server at %s", server_url)
+            return sse_client(server_url)
+
+        server_params = StdioServerParameters(
+            command="npx",
+            args=["-y", npx_package],
+            env=None
+        )
+        return stdio_client(server_params)
 
     async def _init_youtube_mcp(self):
         """Initialize YouTube MCP server connection"""
+        await self._connect_server(
+            "youtube", "YouTube", settings.MCP_YOUTUBE_SERVER_URL, _YOUTUBE_SERVER_PACKAGE
+        )
+
+    async def _init_web_mcp(self):
+        """Initialize Web Search MCP server connection"""
+        await self._connect_server(
+            "web", "Web Search", settings.MCP_WEB_SERVER_URL, _WEB_SERVER_PACKAGE
+        )
+
+    async def _connect_server(
+        self,
+        server: str,
+        label: str,
+        server_url: Optional[str],
+        npx_package: str
+    ):
+        """
+        Connect one MCP server inside a dedicated owner task
+
+        The stdio/SSE transports are anyio task groups whose cancel scopes
+        must be exited by the task that entered them. Each connection is
+        therefore held open by its own task, which lets servers connect
+        concurrently and be closed from any task.
+
+        Args:
+            server: "youtube" or "web"
+            label: Human readable server name for logs
+            server_url: SSE endpoint of a shared MCP server, if any
+            npx_package: npm package to spawn when no URL is configured
+        """
+        if server in self._server_tasks:
+            return  # Already connected (or connecting) - keep init idempotent
+
+        ready = asyncio.Event()
+        stop = asyncio.Event()
+        task = asyncio.create_task(
+            self._hold_connection(server, label, server_url, npx_package, ready, stop)
+        )
+        self._server_tasks[server] = (task, stop)
+        await ready.wait()
+
+        if server not in self.sessions:
+            # Connection failed - allow a later initialize() to retry
+            self._server_tasks.pop(server, None)
+
+    async def _hold_connection(
+        self,
+        server: str,
+        label: str,
+        server_url: Optional[str],
+        npx_package: str,
+        ready: asyncio.Event,
+        stop: asyncio.Event
+    ):
+        """Open, publish and hold one MCP session until ``stop`` is set"""
         try:
-            logger.info("Connecting to YouTube MCP server...")
+            logger.info("Connecting to %s MCP server...", label)
 
-            server_params = StdioServerParameters(
-                command="npx",
-                args=["-y", "@modelcontextprotocol/server-youtube"],
-                env=None
-            )
+            # One exit stack per connection: unwinds whatever was entered,
+            # in reverse order, however far the connect got
+            async with AsyncExitStack() as stack:
+                read, write = await stack.enter_async_context(
+                    self._open_transport(server_url, npx_package)
+                )
+                session = await stack.enter_async_context(ClientSession(read, write))
+                await session.initialize()
 
-            # Create client session (manual lifecycle management)
-            self.youtube_stdio = stdio_client(server_params)
-            self.youtube_read, self.youtube_write = await self.youtube_stdio.__aenter__()
+                self.sessions[server] = session
+                logger.info("✅ %s MCP connected", label)
+                ready.set()
 
-            self.youtube_session = ClientSession(self.youtube_read, self.youtube_write)
-            await self.youtube_session.__aenter__()
-            await self.youtube_session.initialize()
+                await stop.wait()
 
-            logger.info("✅ YouTube MCP connected")
+            logger.info("Closed %s MCP session", label)
 
         except Exception as e:
-            logger.warning(f"YouTube MCP connection failed: {e}")
-            logger.info("YouTube research will use fallback method")
-            self.youtube_session = None
-            self.youtube_stdio = None
+            logger.warning("%s MCP connection failed: %s", label, e)
+            logger.info("%s search will use fallback method", label)
+        finally:
+            # Closing the exit stack above also reaps the subprocess
+            self.sessions.pop(server, None)
+            ready.set()
+
+    def _breaker_open(self, server: str) -> bool:
+        """
+        Check whether calls to a server should skip straight to fallback
 
-    async def _init_web_mcp(self):
-        """Initialize Web Search MCP server connection"""
-        try:
-            logger.info("Connecting to Web Search MCP server...")
+        After the cooldown the breaker is half-open: the next call goes
+        through as a probe, and a single failure re-opens it.
+        """
+        opened_at = self._breakers[server]["opened_at"]
+        return bool(opened_at) and time.monotonic() - opened_at < self.BREAKER_COOLDOWN_SECONDS
+
+    def _record_failure(self, server: str):
+        """Count a failed call and open the breaker at the threshold"""
+        breaker = self._breakers[server]
+        breaker["fails"] += 1
+        if breaker["fails"] >= self.BREAKER_FAILURE_THRESHOLD:
+            if not self._breaker_open(server):
+                logger.warning(
+                    "%s MCP circuit opened after %d consecutive failures",
+                    server, breaker["fails"]
+                )
+            breaker["opened_at"] = time.monotonic()
+
+    def _record_success(self, server: str):
+        """Close the breaker after a successful call"""
+        breaker = self._breakers[server]
+        breaker["fails"] = 0
+        breaker["opened_at"] = 0.0
+
+    async def _cached_search(
+        self,
+        key: tuple,
+        factory: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Serve repeated searches from a TTL + LRU cache
 
-            server_params = StdioServerParameters(
-                command="npx",
-                args=["-y", "@modelcontextprotocol/server-brave-search"],
-                env=None
-            )
+        Empty results (errors, fallbacks) are never cached.
 
-            self.web_stdio = stdio_client(server_params)
-            self.web_read, self.web_write = await self.web_stdio.__aenter__()
+        Args:
+            key: (server, query, max_results) identifying the search
+            factory: Runs the search on a cache miss
+
+        Returns:
+            Search results (a private copy on cache hits)
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            stored_at, results = entry
+            if time.monotonic() - stored_at < self.CACHE_TTL_SECONDS:
+                self._cache.move_to_end(key)
+                self.metrics.cache_hits += 1
+                return list(results)
+            del self._cache[key]
+
+        self.metrics.cache_misses += 1
+        results = await self._coalesce(key, factory)
+
+        if results:
+            self._cache[key] = (time.monotonic(), list(results))
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
 
-            self.web_session = ClientSession(self.web_read, self.web_write)
-            await self.web_session.__aenter__()
-            await self.web_session.initialize()
+        return results
 
-            logger.info("✅ Web Search MCP connected")
+    async def _probe_session(self, server: str):
+        """
+        Health-check a session whose last call timed out
 
+        A cheap list_tools() round trip tells a slow call apart from a
+        wedged stdio subprocess. If the probe fails, the connection is
+        torn down and re-spawned instead of paying the full call timeout
+        on every later search.
+
+        Args:
+            server: "youtube" or "web"
+        """
+        self._suspect.discard(server)  # First caller probes; others proceed
+
+        session = self.sessions.get(server)
+        if session is not None:
+            try:
+                await asyncio.wait_for(session.list_tools(), timeout=MCP_PROBE_TIMEOUT)
+                return
+            except Exception as e:
+                logger.warning(
+                    "%s MCP failed health probe (%s), reconnecting",
+                    server, str(e) or type(e).__name__
+                )
+
+        await self._disconnect_server(server)
+        if server == "youtube":
+            await self._init_youtube_mcp()
+        else:
+            await self._init_web_mcp()
+
+    async def _disconnect_server(self, server: str):
+        """Signal a server's owner task to close and wait for teardown"""
+        entry = self._server_tasks.pop(server, None)
+        if entry is None:
+            return
+
+        task, stop = entry
+        stop.set()
+        try:
+            await task
         except Exception as e:
-            logger.warning(f"Web Search MCP connection failed: {e}")
-            logger.info("Web search will use fallback method")
-            self.web_session = None
-            self.web_stdio = None
+            logger.error("Error closing %s MCP: %s", server, e)
+
+    async def _coalesce(
+        self,
+        key: tuple,
+        factory: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Share one in-flight search between concurrent identical callers
+
+        Args:
+            key: (server, query, max_results) identifying the search
+            factory: Starts the search when no identical one is in flight
+
+        Returns:
+            Search results (a private copy for coalesced callers)
+        """
+        task = self._inflight.get(key)
+        owner = task is None
+        if owner:
+            # The search runs as its own task, so no single caller owns it
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+
+            def finished(done: asyncio.Future):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                if not done.cancelled():
+                    done.exception()  # Mark retrieved even if every caller left
+
+            task.add_done_callback(finished)
+
+        # Everyone awaits through a shield, so a caller's cancellation only
+        # affects that caller - the shared search and other waiters go on
+        result = await asyncio.shield(task)
+        return result if owner else list(result)
 
     async def search_youtube(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """
@@ -179,6 +583,36 @@ class MCPClientService:
         Returns:
             List of video results with metadata
         """
+        return await self._search("youtube", query, max_results)
+
+    async def search_web(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search web via MCP
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+
+        Returns:
+            List of web search results
+        """
+        return await self._search("web", query, max_results)
+
+    async def _search(self, server: str, query: str, max_results: int) -> List[Dict[str, Any]]:
+        """
+        Shared search path for every MCP server
+
+        Sanitizes and validates input, then serves the search from the
+        cache, an identical in-flight search, or a new MCP call.
+
+        Args:
+            server: Key into _SERVERS ("youtube" / "web")
+            query: Search query
+            max_results: Maximum number of results
+
+        Returns:
+            List of search results
+        """
         # Sanitize input
         sanitized_query = self._sanitize_query(query)
         validated_max_results = self._validate_max_results(max_results)
@@ -187,167 +621,296 @@ class MCPClientService:
             logger.warning("Empty or invalid query after sanitization")
             return []
 
-        # Update metrics
-        self.metrics["youtube_calls"] += 1
+        return await self._cached_search(
+            (server, sanitized_query, validated_max_results),
+            lambda: self._search_mcp(server, sanitized_query, validated_max_results)
+        )
+
+    async def _search_mcp(
+        self,
+        server: str,
+        sanitized_query: str,
+        validated_max_results: int
+    ) -> List[Dict[str, Any]]:
+        """Run one MCP search for an already-sanitized query"""
+        # Update metrics - one branch on server, then plain slot increments
+        metrics = self.metrics
+        youtube = server == "youtube"
+        if youtube:
+            metrics.youtube_calls += 1
+        else:
+            metrics.web_calls += 1
+
+        results, succeeded = await self._run_mcp_search(server, sanitized_query, validated_max_results)
+
+        if youtube:
+            if succeeded:
+                metrics.youtube_success += 1
+            else:
+                metrics.youtube_errors += 1
+        elif succeeded:
+            metrics.web_success += 1
+        else:
+            metrics.web_errors += 1
+        return results
+
+    async def _run_mcp_search(
+        self,
+        server: str,
+        sanitized_query: str,
+        validated_max_results: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Search through MCP, falling back on failure; returns (results, succeeded)"""
+        spec = _SERVERS[server]
+        fallback = getattr(self, spec.fallback)
 
-        if not self.youtube_session:
-            logger.warning("YouTube MCP not available, using fallback")
-            self.metrics["youtube_errors"] += 1
-            return await self._fallback_youtube_search(sanitized_query)
+        if self._breaker_open(server):
+            logger.debug("%s MCP circuit open, using fallback", spec.label)
+            return await fallback(sanitized_query), False
+
+        if server in self._suspect:
+            await self._probe_session(server)
+
+        session = self.sessions.get(server)
+        if session is None:
+            logger.warning("%s MCP not available, using fallback", spec.label)
+            return await fallback(sanitized_query), False
 
         try:
-            # Call YouTube MCP tool with timeout
-            result = await asyncio.wait_for(
-                self.youtube_session.call_tool(
-                    "youtube_search",
-                    arguments={
-                        "query": sanitized_query,
-                        "maxResults": validated_max_results
-                    }
-                ),
-                timeout=30.0  # 30 second timeout
-            )
+            result = await self._call_search_tool(server, session, sanitized_query, validated_max_results)
 
             # Parse results
             if result and result.content:
-                videos = self._parse_youtube_results(result.content)
-                logger.info(f"Found {len(videos)} YouTube videos for '{sanitized_query}'")
-                self.metrics["youtube_success"] += 1
-                return videos
+                results = await self._parse_mcp_results(
+                    result.content, spec.result_key, validated_max_results
+                )
+                logger.info("Found %d %s results for %r", len(results), spec.label, sanitized_query)
+                self._record_success(server)
+                return results, True
 
-            self.metrics["youtube_errors"] += 1
-            return []
+            return [], False
 
         except asyncio.TimeoutError:
-            logger.error(f"YouTube MCP search timed out after 30s for: {sanitized_query}")
-            self.metrics["youtube_errors"] += 1
-            return await self._fallback_youtube_search(sanitized_query)
+            logger.error(
+                "%s MCP search timed out after %.0fs for: %s",
+                spec.label, MCP_CALL_TIMEOUT, sanitized_query
+            )
+            self._record_failure(server)
+            self._suspect.add(server)
+            return await fallback(sanitized_query), False
         except Exception as e:
-            logger.error(f"YouTube MCP search failed: {e}", exc_info=True)
-            self.metrics["youtube_errors"] += 1
-            return await self._fallback_youtube_search(sanitized_query)
+            logger.error("%s MCP search failed: %s", spec.label, e, exc_info=True)
+            self._record_failure(server)
+            return await fallback(sanitized_query), False
+
+    async def _call_search_tool(
+        self,
+        server: str,
+        session: ClientSession,
+        sanitized_query: str,
+        validated_max_results: int
+    ):
+        """Call a server's search tool, bounded by its concurrency limit and timeout"""
+        spec = _SERVERS[server]
+        async with self._call_limits[server]:
+            return await asyncio.wait_for(
+                session.call_tool(
+                    spec.tool,
+                    arguments=spec.arguments(sanitized_query, validated_max_results)
+                ),
+                timeout=MCP_CALL_TIMEOUT
+            )
 
-    async def search_web(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    async def iter_web_results(
+        self,
+        query: str,
+        max_results: int = 10
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Search web via MCP
+        Stream web search results one at a time
+
+        Results are yielded as the streaming parser produces them, so
+        the caller can start on the first result before later (heavy)
+        entries are parsed. Large payloads are parsed in the executor
+        in small batches. Cached results and the fallback path go
+        through search_web.
 
         Args:
             query: Search query
             max_results: Maximum number of results
 
-        Returns:
-            List of web search results
+        Yields:
+            Web search result dicts
         """
-        # Sanitize input
         sanitized_query = self._sanitize_query(query)
         validated_max_results = self._validate_max_results(max_results)
 
-        if not sanitized_query:
-            logger.warning("Empty or invalid query after sanitization")
-            return []
+        session = self.sessions.get("web")
+        key = ("web", sanitized_query, validated_max_results)
+        if (
+            not sanitized_query
+            or session is None
+            or self._breaker_open("web")
+            or "web" in self._suspect
+            or key in self._cache
+            or key in self._inflight
+        ):
+            for item in await self.search_web(query, max_results):
+                yield item
+            return
 
-        # Update metrics
-        self.metrics["web_calls"] += 1
+        self.metrics.web_calls += 1
+        try:
+            result = await self._call_search_tool("web", session, sanitized_query, validated_max_results)
+        except Exception as e:
+            logger.error("Web Search MCP stream failed: %s", str(e) or type(e).__name__)
+            self.metrics.web_errors += 1
+            self._record_failure("web")
+            if isinstance(e, asyncio.TimeoutError):
+                self._suspect.add("web")
+            return
 
-        if not self.web_session:
-            logger.warning("Web Search MCP not available, using fallback")
-            self.metrics["web_errors"] += 1
-            return await self._fallback_web_search(sanitized_query)
+        data = self._content_payload(result.content) if result else None
+        if data is None:
+            self.metrics.web_errors += 1
+            return
 
+        self._record_success("web")
+        self.metrics.web_success += 1
+        items = islice(_iter_results(data, "results"), validated_max_results)
         try:
-            # Call Web Search MCP tool with timeout
-            result = await asyncio.wait_for(
-                self.web_session.call_tool(
-                    "brave_web_search",
-                    arguments={
-                        "query": sanitized_query,
-                        "count": validated_max_results
-                    }
-                ),
-                timeout=30.0  # 30 second timeout
-            )
+            if len(data) > STREAM_PARSE_THRESHOLD:
+                # Large payloads are parsed in the executor, a batch at a time
+                loop = asyncio.get_running_loop()
+                while True:
+                    batch = await loop.run_in_executor(None, list, islice(items, 8))
+                    if not batch:
+                        break
+                    for item in batch:
+                        yield item
+            else:
+                for index, item in enumerate(items):
+                    yield item
+                    if index % 8 == 7:
+                        await asyncio.sleep(0)  # Let other tasks run between batches
+        except _JSON_ERRORS:
+            logger.warning("Could not parse MCP 'results' stream as JSON")
+
+    async def search_all(
+        self,
+        query: str,
+        max_youtube: int = 5,
+        max_web: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search YouTube and the web concurrently
 
-            # Parse results
-            if result and result.content:
-                results = self._parse_web_results(result.content)
-                logger.info(f"Found {len(results)} web results for '{sanitized_query}'")
-                self.metrics["web_success"] += 1
-                return results
+        Args:
+            query: Search query
+            max_youtube: Maximum number of YouTube results
+            max_web: Maximum number of web results
 
-            self.metrics["web_errors"] += 1
-            return []
+        Returns:
+            Dictionary with "youtube" and "web" result lists
+        """
+        sanitized_query = self._sanitize_query(query)
+        if not sanitized_query:
+            logger.warning("Empty or invalid query after sanitization")
+            return {"youtube": [], "web": []}
+
+        youtube, web = await asyncio.gather(
+            self.search_youtube(sanitized_query, max_youtube),
+            self.search_web(sanitized_query, max_web),
+            return_exceptions=True
+        )
+
+        if isinstance(youtube, Exception):
+            logger.error("YouTube search in batch failed: %s", youtube)
+            youtube = []
+        if isinstance(web, Exception):
+            logger.error("Web search in batch failed: %s", web)
+            web = []
+
+        return {"youtube": youtube, "web": web}
+
+    async def _parse_mcp_results(
+        self,
+        content: Any,
+        key: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse MCP tool results
 
-        except asyncio.TimeoutError:
-            logger.error(f"Web Search MCP timed out after 30s for: {sanitized_query}")
-            self.metrics["web_errors"] += 1
-            return await self._fallback_web_search(sanitized_query)
-        except Exception as e:
-            logger.error(f"Web Search MCP failed: {e}", exc_info=True)
-            self.metrics["web_errors"] += 1
-            return await self._fallback_web_search(sanitized_query)
+        Args:
+            content: Tool result content (list of content parts or raw value)
+            key: Top-level key wrapping the result list ("items" / "results")
+            limit: Maximum number of results to parse
 
-    def _parse_youtube_results(self, content: Any) -> List[Dict[str, Any]]:
-        """Parse YouTube MCP results"""
-        videos = []
+        Returns:
+            List of parsed results (empty if content is unparseable)
+        """
+        data = self._content_payload(content)
+        if data is None:
+            return []
 
         try:
-            # MCP results come as text or JSON
-            if isinstance(content, list):
-                data = content[0].text if hasattr(content[0], 'text') else str(content[0])
-            else:
-                data = str(content)
-
-            # Try to parse as JSON
-            if isinstance(data, str):
-                try:
-                    parsed = json.loads(data)
-                    if isinstance(parsed, list):
-                        videos = parsed
-                    elif isinstance(parsed, dict) and 'items' in parsed:
-                        videos = parsed['items']
-                except json.JSONDecodeError:
-                    logger.warning("Could not parse YouTube results as JSON")
-
+            return await _extract_results_async(data, key, limit)
+        except _JSON_ERRORS:
+            logger.warning("Could not parse MCP %r results as JSON", key)
         except Exception as e:
-            logger.error(f"Error parsing YouTube results: {e}")
-
-        return videos
+            logger.error("Error parsing MCP %r results: %s", key, e)
 
-    def _parse_web_results(self, content: Any) -> List[Dict[str, Any]]:
-        """Parse Web Search MCP results"""
-        results = []
+        return []
 
-        try:
-            if isinstance(content, list):
-                data = content[0].text if hasattr(content[0], 'text') else str(content[0])
-            else:
-                data = str(content)
-
-            if isinstance(data, str):
-                try:
-                    parsed = json.loads(data)
-                    if isinstance(parsed, list):
-                        results = parsed
-                    elif isinstance(parsed, dict) and 'results' in parsed:
-                        results = parsed['results']
-                except json.JSONDecodeError:
-                    logger.warning("Could not parse web results as JSON")
+    def _content_payload(self, content: Any) -> Optional[Union[str, bytes, bytearray, memoryview]]:
+        """
+        Pick the raw JSON payload out of MCP tool result content
 
-        except Exception as e:
-            logger.error(f"Error parsing web results: {e}")
+        Args:
+            content: Tool result content (list of content parts or raw value)
 
-        return results
+        Returns:
+            The payload buffer, or None if there is no text payload
+        """
+        # MCP results come as text content parts (or a raw JSON str/bytes
+        # payload, which orjson parses directly without decoding first).
+        # Inspect the type once and pass the original buffer through.
+        if isinstance(content, list):
+            if not content:
+                return None
+            first = content[0]
+        else:
+            first = content
+
+        if isinstance(first, TextContent):
+            data = first.text
+        elif isinstance(first, _RAW_PAYLOAD_TYPES):
+            data = first
+        else:
+            # Image/resource parts can carry megabytes of base64 - never stringify them
+            self._log_skipped_content(first)
+            return None
+
+        return data
+
+    def _log_skipped_content(self, part: Any):
+        """Log each unsupported MCP content type once instead of per call"""
+        type_name = type(part).__name__
+        if type_name not in self._skipped_content_types:
+            self._skipped_content_types.add(type_name)
+            logger.debug("skipping non-text MCP content part: %s", type_name)
 
     async def _fallback_youtube_search(self, query: str) -> List[Dict[str, Any]]:
         """Fallback YouTube search when MCP not available"""
-        logger.warning(f"YouTube search not available for: {query}")
+        logger.warning("YouTube search not available for: %s", query)
         logger.warning("Configure MCP_YOUTUBE_ENABLED and ensure npx is installed")
         # Return empty list - no mock data
         return []
 
     async def _fallback_web_search(self, query: str) -> List[Dict[str, Any]]:
         """Fallback web search when MCP not available"""
-        logger.warning(f"Web search not available for: {query}")
+        logger.warning("Web search not available for: %s", query)
         logger.warning("Configure MCP_WEB_SCRAPING_ENABLED and ensure npx is installed")
         # Return empty list - no mock data
         return []
@@ -359,90 +922,92 @@ class MCPClientService:
         Returns:
             Dictionary with current metrics
         """
-        total_calls = self.metrics["youtube_calls"] + self.metrics["web_calls"]
-        total_success = self.metrics["youtube_success"] + self.metrics["web_success"]
-        total_errors = self.metrics["youtube_errors"] + self.metrics["web_errors"]
+        total_calls = self.metrics.youtube_calls + self.metrics.web_calls
+        total_success = self.metrics.youtube_success + self.metrics.web_success
+        total_errors = self.metrics.youtube_errors + self.metrics.web_errors
 
         success_rate = (total_success / total_calls * 100) if total_calls > 0 else 0.0
 
         return {
-            **self.metrics,
+            **self.metrics.as_dict(),
             "total_calls": total_calls,
             "total_success": total_success,
             "total_errors": total_errors,
             "success_rate": round(success_rate, 2),
             "youtube_success_rate": round(
-                (self.metrics["youtube_success"] / self.metrics["youtube_calls"] * 100)
-                if self.metrics["youtube_calls"] > 0 else 0.0,
+                (self.metrics.youtube_success / self.metrics.youtube_calls * 100)
+                if self.metrics.youtube_calls > 0 else 0.0,
                 2
             ),
             "web_success_rate": round(
-                (self.metrics["web_success"] / self.metrics["web_calls"] * 100)
-                if self.metrics["web_calls"] > 0 else 0.0,
+                (self.metrics.web_success / self.metrics.web_calls * 100)
+                if self.metrics.web_calls > 0 else 0.0,
                 2
             ),
+            "youtube_breaker_open": self._breaker_open("youtube"),
+            "youtube_consecutive_failures": self._breakers["youtube"]["fails"],
+            "web_breaker_open": self._breaker_open("web"),
+            "web_consecutive_failures": self._breakers["web"]["fails"],
         }
 
     async def close(self):
         """Close MCP connections"""
         # Log final metrics
-        metrics = self.get_metrics()
-        logger.info(f"MCP Client metrics on shutdown: {metrics}")
+        logger.info("MCP Client metrics on shutdown: %s", self.get_metrics())
 
-        if self.youtube_session:
-            try:
-                await self.youtube_session.__aexit__(None, None, None)
-                await self.youtube_stdio.__aexit__(None, None, None)
-                logger.info("Closed YouTube MCP session")
-            except Exception as e:
-                logger.error(f"Error closing YouTube MCP: {e}")
-            finally:
-                self.youtube_session = None
-                self.youtube_stdio = None
-
-        if self.web_session:
-            try:
-                await self.web_session.__aexit__(None, None, None)
-                await self.web_stdio.__aexit__(None, None, None)
-                logger.info("Closed Web MCP session")
-            except Exception as e:
-                logger.error(f"Error closing Web MCP: {e}")
-            finally:
-                self.web_session = None
-                self.web_stdio = None
+        # Servers are independent - tear them down concurrently
+        await asyncio.gather(
+            *(self._disconnect_server(server) for server in list(self._server_tasks)),
+            return_exceptions=True
+        )
 
         self._initialized = False
         logger.info("MCP client connections closed")
 
 
-# Global MCP client instance
-_mcp_client: Optional[MCPClientService] = None
-_mcp_client_lock = asyncio.Lock()  # Add lock for thread-safety
+# Global MCP client instance - resolved once, then awaited for free
+_mcp_client_future: Optional[asyncio.Future] = None
 
 
 async def get_mcp_client() -> MCPClientService:
     """
-    Get or create MCP client instance (thread-safe)
+    Get or create MCP client instance
+
+    The first caller creates a Future and initializes the client; every
+    concurrent or later caller awaits that same Future. Awaiting an
+    already-resolved Future returns immediately, so there is no lock and
+    no double-check on the hot path.
 
     Returns:
         MCPClientService instance
     """
-    global _mcp_client
+    global _mcp_client_future
 
-    if _mcp_client is None:
-        async with _mcp_client_lock:  # Thread-safe initialization
-            # Double-check after acquiring lock
-            if _mcp_client is None:
-                _mcp_client = MCPClientService()
-                await _mcp_client.initialize()
+    if _mcp_client_future is None:
+        future = asyncio.get_running_loop().create_future()
+        _mcp_client_future = future
+        try:
+            client = MCPClientService()
+            await client.initialize()
+        except BaseException as e:
+            # Let the next caller retry instead of caching the failure
+            _mcp_client_future = None
+            future.set_exception(e)
+            future.exception()  # Mark retrieved - re-raised below
+            raise
+        future.set_result(client)
 
-    return _mcp_client
+    return await asyncio.shield(_mcp_client_future)
 
 
 async def close_mcp_client():
     """Close global MCP client"""
-    global _mcp_client
+    global _mcp_client_future
+
+    future = _mcp_client_future
+    if future is None:
+        return
 
-    if _mcp_client:
-        await _mcp_client.close()
-        _mcp_client = None
+    _mcp_client_future = None
+    if future.done() and not future.cancelled() and future.exception() is None:
+        await future.result().close()
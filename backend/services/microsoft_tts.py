@@ -5,13 +5,63 @@ FREE - No API Key Required!
 """
 
 import logging
-from typing import Optional, List, Dict
+import time
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator, Union
 from pathlib import Path
 import asyncio
 import edge_tts
 
+from core.http import stream_to_file
+
 logger = logging.getLogger(__name__)
 
+# Popular voices across different languages, pre-expanded once at import
+_POPULAR_VOICES = tuple(
+    {
+        "id": v["id"],
+        "name": v["name"],
+        "description": f"Microsoft Edge TTS - {v['name']}",
+        "language": v["language"],
+        "gender": v["gender"],
+        "is_premium": False,  # FREE!
+        "price_per_token": 0.0  # FREE!
+    }
+    for v in (
+        # German
+        {"id": "de-DE-KatjaNeural", "name": "Katja (German, Female)", "language": "de", "gender": "female"},
+        {"id": "de-DE-ConradNeural", "name": "Conrad (German, Male)", "language": "de", "gender": "male"},
+        {"id": "de-DE-AmalaNeural", "name": "Amala (German, Female)", "language": "de", "gender": "female"},
+
+        # English US
+        {"id": "en-US-AriaNeural", "name": "Aria (US, Female)", "language": "en", "gender": "female"},
+        {"id": "en-US-GuyNeural", "name": "Guy (US, Male)", "language": "en", "gender": "male"},
+        {"id": "en-US-JennyNeural", "name": "Jenny (US, Female)", "language": "en", "gender": "female"},
+
+        # English UK
+        {"id": "en-GB-SoniaNeural", "name": "Sonia (UK, Female)", "language": "en", "gender": "female"},
+        {"id": "en-GB-RyanNeural", "name": "Ryan (UK, Male)", "language": "en", "gender": "male"},
+
+        # Spanish
+        {"id": "es-ES-ElviraNeural", "name": "Elvira (Spanish, Female)", "language": "es", "gender": "female"},
+        {"id": "es-ES-AlvaroNeural", "name": "Alvaro (Spanish, Male)", "language": "es", "gender": "male"},
+
+        # French
+        {"id": "fr-FR-DeniseNeural", "name": "Denise (French, Female)", "language": "fr", "gender": "female"},
+        {"id": "fr-FR-HenriNeural", "name": "Henri (French, Male)", "language": "fr", "gender": "male"},
+
+        # Italian
+        {"id": "it-IT-ElsaNeural", "name": "Elsa (Italian, Female)", "language": "it", "gender": "female"},
+        {"id": "it-IT-DiegoNeural", "name": "Diego (Italian, Male)", "language": "it", "gender": "male"},
+
+        # Japanese
+        {"id": "ja-JP-NanamiNeural", "name": "Nanami (Japanese, Female)", "language": "ja", "gender": "female"},
+        {"id": "ja-JP-KeitaNeural", "name": "Keita (Japanese, Male)", "language": "ja", "gender": "male"},
+    )
+)
+
+# Full voice list rarely changes - refresh from the API at most hourly
+VOICE_CACHE_TTL_SECONDS = 3600.0
+
 class MicrosoftTTSService:
     """
     Microsoft Edge Text-to-Speech Service using edge-tts library
@@ -28,6 +78,16 @@ class MicrosoftTTSService:
     Docs: https://github.com/rany2/edge-tts
     """
 
+    # Shared across instances: (fetched_at, voices) and its refresh lock
+    _voices_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+    _voices_lock: Optional[asyncio.Lock] = None
+
+    # (source voice list, (language, gender) -> voices) - see _get_voice_index
+    _voice_index: Optional[Tuple[List[Dict[str, Any]], Dict[tuple, List[Dict[str, Any]]]]] = None
+
+    # (rate, pitch, volume) for speed=1.0, pitch=0.0, volume=1.0
+    _DEFAULT_PROSODY = ("+0%", "+0Hz", "+0%")
+
     def __init__(self):
         """Initialize Microsoft Edge TTS service (no API key needed!)"""
         logger.info("Microsoft Edge TTS initialized - FREE service, no API key required")
@@ -38,18 +98,32 @@ class MicrosoftTTSService:
 
     async def get_all_voices(self) -> List[Dict[str, any]]:
         """
-        Get all available voices from Edge TTS API
+        Get all available voices from Edge TTS API (cached for an hour)
 
         Returns:
             List of all voice objects (400+)
         """
-        try:
-            voices_list = await edge_tts.list_voices()
-            logger.info(f"Loaded {len(voices_list)} Microsoft Edge TTS voices")
-            return voices_list
-        except Exception as e:
-            logger.error(f"Error loading Edge TTS voices: {e}")
-            return []
+        cached = MicrosoftTTSService._voices_cache
+        if cached and time.monotonic() - cached[0] < VOICE_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        if MicrosoftTTSService._voices_lock is None:
+            MicrosoftTTSService._voices_lock = asyncio.Lock()
+
+        # One refresh at a time - concurrent callers reuse its result
+        async with MicrosoftTTSService._voices_lock:
+            cached = MicrosoftTTSService._voices_cache
+            if cached and time.monotonic() - cached[0] < VOICE_CACHE_TTL_SECONDS:
+                return cached[1]
+
+            try:
+                voices_list = await edge_tts.list_voices()
+                logger.info(f"Loaded {len(voices_list)} Microsoft Edge TTS voices")
+                MicrosoftTTSService._voices_cache = (time.monotonic(), voices_list)
+                return voices_list
+            except Exception as e:
+                logger.error(f"Error loading Edge TTS voices: {e}")
+                return []
 
     def get_voices(self) -> List[Dict[str, str]]:
         """
@@ -61,50 +135,8 @@ class MicrosoftTTSService:
         Returns:
             List of popular voice info dicts
         """
-        # Popular voices across different languages
-        popular_voices = [
-            # German
-            {"id": "de-DE-KatjaNeural", "name": "Katja (German, Female)", "language": "de", "gender": "female"},
-            {"id": "de-DE-ConradNeural", "name": "Conrad (German, Male)", "language": "de", "gender": "male"},
-            {"id": "de-DE-AmalaNeural", "name": "Amala (German, Female)", "language": "de", "gender": "female"},
-
-            # English US
-            {"id": "en-US-AriaNeural", "name": "Aria (US, Female)", "language": "en", "gender": "female"},
-            {"id": "en-US-GuyNeural", "name": "Guy (US, Male)", "language": "en", "gender": "male"},
-            {"id": "en-US-JennyNeural", "name": "Jenny (US, Female)", "language": "en", "gender": "female"},
-
-            # English UK
-            {"id": "en-GB-SoniaNeural", "name": "Sonia (UK, Female)", "language": "en", "gender": "female"},
-            {"id": "en-GB-RyanNeural", "name": "Ryan (UK, Male)", "language": "en", "gender": "male"},
-
-            # Spanish
-            {"id": "es-ES-ElviraNeural", "name": "Elvira (Spanish, Female)", "language": "es", "gender": "female"},
-            {"id": "es-ES-AlvaroNeural", "name": "Alvaro (Spanish, Male)", "language": "es", "gender": "male"},
-
-            # French
-            {"id": "fr-FR-DeniseNeural", "name": "Denise (French, Female)", "language": "fr", "gender": "female"},
-            {"id": "fr-FR-HenriNeural", "name": "Henri (French, Male)", "language": "fr", "gender": "male"},
-
-            # Italian
-            {"id": "it-IT-ElsaNeural", "name": "Elsa (Italian, Female)", "language": "it", "gender": "female"},
-            {"id": "it-IT-DiegoNeural", "name": "Diego (Italian, Male)", "language": "it", "gender": "male"},
-
-            # Japanese
-            {"id": "ja-JP-NanamiNeural", "name": "Nanami (Japanese, Female)", "language": "ja", "gender": "female"},
-            {"id": "ja-JP-KeitaNeural", "name": "Keita (Japanese, Male)", "language": "ja", "gender": "male"},
-        ]
-
-        voices = []
-        for v in popular_voices:
-            voices.append({
-                "id": v["id"],
-                "name": v["name"],
-                "description": f"Microsoft Edge TTS - {v['name']}",
-                "language": v["language"],
-                "gender": v["gender"],
-                "is_premium": False,  # FREE!
-                "price_per_token": 0.0  # FREE!
-            })
+        # Shallow copies so callers can't mutate the shared module table
+        voices = [dict(v) for v in _POPULAR_VOICES]
 
         logger.info(f"Loaded {len(voices)} popular Microsoft Edge TTS voices")
         return voices
@@ -132,41 +164,9 @@ class MicrosoftTTSService:
                 logger.warning("No voices from API, using fallback")
                 return self.get_voices()
 
-            # Transform and filter voices
-            voices = []
-            for voice in all_voices:
-                # Extract info
-                voice_id = voice.get("ShortName", "")
-                voice_name = voice.get("FriendlyName", voice_id)
-                locale = voice.get("Locale", "en-US")
-                gender_raw = voice.get("Gender", "Female")
-
-                # Extract language code (first 2 chars, e.g., "de" from "de-DE")
-                language = locale.split("-")[0] if "-" in locale else locale[:2]
-
-                # Parse gender
-                gender = "female" if gender_raw.lower() == "female" else "male"
-
-                # Apply filters
-                if language_filter and language != language_filter:
-                    continue
-
-                if gender_filter and gender != gender_filter:
-                    continue
-
-                # Get voice type (Neural is premium quality)
-                voice_type = "Neural" if "Neural" in voice_id else "Standard"
-
-                voices.append({
-                    "id": voice_id,
-                    "name": voice_name,
-                    "description": f"Microsoft {voice_type} - {locale}",
-                    "language": language,
-                    "gender": gender,
-                    "locale": locale,
-                    "is_premium": False,  # FREE but high quality!
-                    "price_per_token": 0.0  # FREE!
-                })
+            # Index lookup instead of a linear scan per request
+            index = self._get_voice_index(all_voices)
+            voices = list(index.get((language_filter or None, gender_filter or None), []))
 
             logger.info(f"Loaded {len(voices)} filtered Microsoft Edge TTS voices")
             return voices
@@ -184,6 +184,126 @@ class MicrosoftTTSService:
 
             return voices
 
+    def _get_voice_index(
+        self,
+        all_voices: List[Dict[str, Any]]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], List[Dict[str, Any]]]:
+        """
+        Build (once per fetched voice list) a (language, gender) -> voices index
+
+        Every voice is listed under its exact key plus the wildcard keys
+        (language, None), (None, gender) and (None, None), so any filter
+        combination is a single dict lookup. The index is rebuilt when
+        get_all_voices() hands out a refreshed list.
+
+        Args:
+            all_voices: Raw voice objects from edge-tts
+
+        Returns:
+            Filter key -> transformed voice dicts
+        """
+        cached = MicrosoftTTSService._voice_index
+        if cached is not None and cached[0] is all_voices:
+            return cached[1]
+
+        index: Dict[Tuple[Optional[str], Optional[str]], List[Dict[str, Any]]] = {}
+        for voice in all_voices:
+            # Extract info
+            voice_id = voice.get("ShortName", "")
+            voice_name = voice.get("FriendlyName", voice_id)
+            locale = voice.get("Locale", "en-US")
+            gender_raw = voice.get("Gender", "Female")
+
+            # Extract language code (first 2 chars, e.g., "de" from "de-DE")
+            language = locale.split("-")[0] if "-" in locale else locale[:2]
+
+            # Parse gender
+            gender = "female" if gender_raw.lower() == "female" else "male"
+
+            # Get voice type (Neural is premium quality)
+            voice_type = "Neural" if "Neural" in voice_id else "Standard"
+
+            entry = {
+                "id": voice_id,
+                "name": voice_name,
+                "description": f"Microsoft {voice_type} - {locale}",
+                "language": language,
+                "gender": gender,
+                "locale": locale,
+                "is_premium": False,  # FREE but high quality!
+                "price_per_token": 0.0  # FREE!
+            }
+
+            for key in ((None, None), (language, None), (None, gender), (language, gender)):
+                index.setdefault(key, []).append(entry)
+
+        MicrosoftTTSService._voice_index = (all_voices, index)
+        return index
+
+    def _create_communicate(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        pitch: float,
+        volume: float
+    ) -> edge_tts.Communicate:
+        """Create an Edge TTS communicator with SSML-compatible parameters"""
+        if speed == 1.0 and pitch == 0.0 and volume == 1.0:
+            # Fast path - nearly every call uses the defaults
+            rate_str, pitch_str, volume_str = self._DEFAULT_PROSODY
+        else:
+            # Convert parameters to SSML-compatible format
+            # Rate: -50% to +100% (round, so 1.15 doesn't truncate to +14%)
+            rate_str = f"{round((speed - 1.0) * 100):+d}%"
+
+            # Pitch: -50Hz to +50Hz
+            pitch_str = f"{pitch:+.0f}Hz"
+
+            # Volume: relative to default, -100% to +0%
+            # (edge-tts only accepts signed percentages)
+            volume_str = f"{round((volume - 1.0) * 100):+d}%"
+
+        # Create Edge TTS communicator
+        return edge_tts.Communicate(
+            text=text,
+            voice=voice,
+            rate=rate_str,
+            pitch=pitch_str,
+            volume=volume_str
+        )
+
+    async def generate_speech_stream(
+        self,
+        text: str,
+        voice: str = "en-US-AriaNeural",
+        speed: float = 1.0,
+        pitch: float = 0.0,
+        volume: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech audio chunks as Edge TTS produces them
+
+        Lets consumers (e.g. a FastAPI StreamingResponse) start playback
+        before synthesis has finished.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID (e.g., "de-DE-KatjaNeural", "en-US-AriaNeural")
+            speed: Speed multiplier (0.5 - 2.0)
+            pitch: Pitch adjustment in Hz (-50 to +50)
+            volume: Volume multiplier (0.0 - 1.0)
+
+        Yields:
+            MP3 audio chunks
+        """
+        logger.info(f"Streaming speech with Microsoft Edge TTS: {len(text)} chars, voice={voice}")
+
+        communicate = self._create_communicate(text, voice, speed, pitch, volume)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
     async def generate_speech(
         self,
         text: str,
@@ -191,7 +311,8 @@ class MicrosoftTTSService:
         speed: float = 1.0,
         pitch: float = 0.0,
         volume: float = 1.0,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        return_bytes: bool = True
     ) -> bytes:
         """
         Generate speech from text using Microsoft Edge TTS
@@ -203,6 +324,8 @@ class MicrosoftTTSService:
             pitch: Pitch adjustment in Hz (-50 to +50)
             volume: Volume multiplier (0.0 - 1.0)
             output_path: Optional path to save audio file
+            return_bytes: Also return the audio when saving to output_path
+                (False skips buffering and returns b"")
 
         Returns:
             Audio bytes (MP3 format)
@@ -213,41 +336,32 @@ class MicrosoftTTSService:
         logger.info(f"Generating speech with Microsoft Edge TTS: {len(text)} chars, voice={voice}")
 
         try:
-            # Convert parameters to SSML-compatible format
-            # Rate: -50% to +100%
-            rate_percent = int((speed - 1.0) * 100)
-            rate_str = f"{rate_percent:+d}%"
+            communicate = self._create_communicate(text, voice, speed, pitch, volume)
 
-            # Pitch: -50Hz to +50Hz
-            pitch_str = f"{pitch:+.0f}Hz"
-
-            # Volume: 0-100%
-            volume_percent = int(volume * 100)
-            volume_str = f"{volume_percent}%"
+            # Generate audio
+            if output_path and not return_bytes:
+                # File only - nothing is buffered in memory, and chunks
+                # are written off the event loop as they arrive
+                await stream_to_file(
+                    output_path,
+                    lambda write, reset: self._pump_audio(communicate, write)
+                )
+                logger.info(f"Saved audio to {output_path}")
+                return b""
 
-            # Create Edge TTS communicator
-            communicate = edge_tts.Communicate(
-                text=text,
-                voice=voice,
-                rate=rate_str,
-                pitch=pitch_str,
-                volume=volume_str
-            )
+            # Collect audio chunks in memory - one join instead of
+            # re-copying the whole buffer on every chunk
+            chunks: List[bytes] = []
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    chunks.append(chunk["data"])
 
-            # Generate audio
-            audio_data = b""
+            audio_data = b"".join(chunks)
 
             if output_path:
-                # Save directly to file
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                await communicate.save(str(output_path))
-                audio_data = output_path.read_bytes()
+                # One write of the joined audio, in a worker thread
+                await asyncio.to_thread(self._save_output, output_path, audio_data)
                 logger.info(f"Saved audio to {output_path}")
-            else:
-                # Collect audio chunks in memory
-                async for chunk in communicate.stream():
-                    if chunk["type"] == "audio":
-                        audio_data += chunk["data"]
 
             logger.info(f"Generated {len(audio_data)} bytes of audio")
             return audio_data
@@ -256,6 +370,80 @@ class MicrosoftTTSService:
             logger.error(f"Microsoft Edge TTS generation failed: {e}")
             raise Exception(f"Failed to generate speech: {e}")
 
+    @staticmethod
+    async def _pump_audio(communicate: edge_tts.Communicate, write) -> int:
+        """Pass each audio chunk of an Edge TTS stream to write; returns the byte count"""
+        size = 0
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                await write(chunk["data"])
+                size += len(chunk["data"])
+        return size
+
+    @staticmethod
+    def _save_output(output_path: Path, audio_bytes: bytes):
+        """Write audio to output_path (run in a worker thread)"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(audio_bytes)
+
+    async def generate_speech_batch(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrent: int = 6
+    ) -> List[Union[bytes, Exception]]:
+        """
+        Generate speech for many clips concurrently
+
+        Identical requests (same text, voice, speed, pitch, volume) are
+        synthesized once and shared; each item's output_path, if given,
+        still receives its own file.
+
+        Args:
+            items: generate_speech keyword arguments, one dict per clip
+            max_concurrent: Maximum simultaneous Edge TTS connections
+
+        Returns:
+            Audio bytes per item, in input order (the Exception instead
+            if that clip failed)
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        defaults = {"voice": "en-US-AriaNeural", "speed": 1.0, "pitch": 0.0, "volume": 1.0}
+
+        def _key(item: Dict[str, Any]) -> tuple:
+            params = {**defaults, **item}
+            return (params["text"], params["voice"], params["speed"], params["pitch"], params["volume"])
+
+        unique: Dict[tuple, Dict[str, Any]] = {}
+        for item in items:
+            unique.setdefault(_key(item), {k: v for k, v in item.items() if k != "output_path"})
+
+        async def _one(params: Dict[str, Any]) -> bytes:
+            async with semaphore:
+                return await self.generate_speech(**params)
+
+        if len(unique) < len(items):
+            logger.info(f"Deduplicated {len(items)} TTS requests to {len(unique)} syntheses")
+
+        results = await asyncio.gather(
+            *(_one(params) for params in unique.values()),
+            return_exceptions=True
+        )
+        audio_by_key = dict(zip(unique.keys(), results))
+
+        outputs: List[Union[bytes, Exception]] = []
+        writes = []
+        for item in items:
+            audio = audio_by_key[_key(item)]
+            output_path = item.get("output_path")
+            if output_path and not isinstance(audio, Exception):
+                writes.append(asyncio.to_thread(self._save_output, output_path, audio))
+            outputs.append(audio)
+
+        # Write every clip's file concurrently, off the event loop
+        await asyncio.gather(*writes)
+
+        return outputs
+
     def calculate_cost(self, character_count: int) -> float:
         """
         Calculate cost for text (always $0 - it's FREE!)
@@ -5,14 +5,188 @@ Production-Ready Implementation - NO MOCKS
 
 import httpx
 import logging
-from typing import Optional, List, Dict
+import hashlib
+import json
+import random
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple
 from pathlib import Path
 import asyncio
 
 from core.config import settings
+from core.http import close_pool, get_pool, stream_to_file
+from services.tts_cache import SpeechCache, speech_cache
 
 logger = logging.getLogger(__name__)
 
+# Optional fast JSON encoder - fall back to stdlib json when missing
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared OpenAI TTS connection pool"""
+    return get_pool("openai_tts", timeout=60.0, max_keepalive_connections=32, max_connections=64)
+
+
+# Sentence boundaries for chunked synthesis
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+class OpenAITTSBatcher:
+    """
+    Coalescing scheduler for OpenAI TTS calls
+
+    Requests are queued; a background worker drains up to ``max_batch``
+    of them, waiting at most ``max_wait_ms`` for more to arrive, and starts
+    one API call per unique cache key. A request whose key is already
+    queued or in flight joins that call instead of adding a new one, so
+    repeated hooks/outros collapse to a single generation.
+
+    The default ``max_wait_ms=0`` groups whatever is submitted in the same
+    event loop tick (e.g. a gather over segments) without adding latency.
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait_ms: float = 0.0):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._running: set = set()
+
+    async def submit(
+        self,
+        service: "OpenAITTSService",
+        key: str,
+        text: str,
+        voice: str,
+        model: str,
+        speed: float,
+        response_format: str = "mp3"
+    ) -> bytes:
+        """Queue a generation (or join an identical one) and wait for its audio"""
+        future = self._pending.get(key)
+        if future is None:
+            self._ensure_worker()
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            self._queue.put_nowait((future, service, key, text, voice, model, speed, response_format))
+        # Shield so a cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(future)
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            for item in batch:
+                task = asyncio.create_task(self._run(*item))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+    async def _run(self, future, service, key, text, voice, model, speed, response_format):
+        try:
+            audio_bytes = await service._generate_uncached(key, text, voice, model, speed, response_format)
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # Mark retrieved - waiters may all be gone
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        else:
+            future.set_result(audio_bytes)
+        finally:
+            self._pending.pop(key, None)
+
+
+class _TTSMetrics:
+    """
+    OpenAI TTS request counters and recent latencies
+
+    TTFB (time to first audio byte) and total request time are kept for
+    the last ``window`` successful requests so percentiles reflect current
+    API behaviour; use total p95 when tuning request timeouts.
+    """
+
+    __slots__ = ("attempts", "successes", "errors", "retries", "cache_hits", "in_flight", "ttfb", "total")
+
+    def __init__(self, window: int = 512):
+        self.attempts = 0      # HTTP requests sent (including retries)
+        self.successes = 0
+        self.errors = 0        # Failed attempts (timeouts, transport, non-200)
+        self.retries = 0
+        self.cache_hits = 0
+        self.in_flight = 0     # Requests currently holding the bulkhead
+        self.ttfb: deque = deque(maxlen=window)
+        self.total: deque = deque(maxlen=window)
+
+    def record_success(self, ttfb: float, total: float):
+        self.successes += 1
+        self.ttfb.append(ttfb)
+        self.total.append(total)
+
+    @staticmethod
+    def _summary(samples: deque) -> Dict[str, float]:
+        if not samples:
+            return {"avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            "avg": round(sum(ordered) / len(ordered), 3),
+            "p50": round(ordered[last // 2], 3),
+            "p95": round(ordered[round(last * 0.95)], 3),
+            "max": round(ordered[last], 3),
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "errors": self.errors,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "in_flight": self.in_flight,
+            "ttfb_seconds": self._summary(self.ttfb),
+            "total_seconds": self._summary(self.total),
+        }
+
+
+# Shared by every OpenAITTSService instance, like the connection pool
+_batcher = OpenAITTSBatcher()
+_metrics = _TTSMetrics()
+
+# Bulkhead: max OpenAI requests in flight across all instances, so a slow
+# OpenAI can't absorb every pending task (other providers keep their own)
+MAX_CONCURRENT_REQUESTS = 16
+_request_limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
 class OpenAITTSService:
     """
     OpenAI Text-to-Speech Service
@@ -21,6 +195,8 @@ class OpenAITTSService:
     """
     
     BASE_URL = "https://api.openai.com/v1/audio/speech"
+    WARMUP_URL = "https://api.openai.com/v1/models"
+    WARMUP_TIMEOUT = 5.0
     
     # Available models
     MODELS = {
@@ -38,6 +214,34 @@ class OpenAITTSService:
         "nova": "Female, energetic",
         "shimmer": "Female, soft"
     }
+
+    # Frozen lookups for per-request validation and gender guessing
+    _VOICES_FS = frozenset(VOICES)
+    _MODELS_FS = frozenset(MODELS)
+    _VOICES_STR = ", ".join(VOICES)
+    _MODELS_STR = ", ".join(MODELS)
+
+    # Output formats; "pcm" is raw 24 kHz mono signed 16-bit little-endian
+    PCM_SAMPLE_RATE = 24000
+    _FORMATS_FS = frozenset({"mp3", "pcm"})
+    _FORMATS_STR = "mp3, pcm"
+    _GENDER = {
+        **dict.fromkeys(("ballad", "coral", "nova", "shimmer"), "female"),
+        **dict.fromkeys(("alloy", "ash", "echo", "fable", "onyx", "sage", "verse"), "male")
+    }
+
+    # Retry policy (full-jitter exponential backoff)
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 10.0
+
+    # Circuit breaker, shared by all instances (they all hit the same API)
+    BREAKER_FAILURE_THRESHOLD = 5
+    BREAKER_COOLDOWN_SECONDS = 30.0
+
+    # Bytes per read when streaming the response body
+    STREAM_CHUNK_SIZE = 64 * 1024
+    _breaker = {"fails": 0, "opened_at": 0.0}
     
     def __init__(self):
         """Initialize OpenAI TTS service"""
@@ -74,21 +278,16 @@ class OpenAITTSService:
     
     def _guess_gender(self, voice_id: str) -> str:
         """Guess gender from voice ID (based on OpenAI documentation)"""
-        female = ["ballad", "coral", "nova", "shimmer"]
-        male = ["alloy", "ash", "echo", "fable", "onyx", "sage", "verse"]
-        if voice_id in female:
-            return "female"
-        elif voice_id in male:
-            return "male"
-        return "neutral"
+        return self._GENDER.get(voice_id, "neutral")
     
     async def generate_speech(
         self,
         text: str,
         voice: str = "alloy",
-        model: str = "tts-1-hd",
+        model: Optional[str] = None,
         speed: float = 1.0,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        response_format: str = "mp3"
     ) -> bytes:
         """
         Generate speech from text
@@ -96,105 +295,540 @@ class OpenAITTSService:
         Args:
             text: Text to convert to speech
             voice: Voice ID (alloy, echo, fable, onyx, nova, shimmer)
-            model: Model to use (tts-1 or tts-1-hd)
+            model: Model to use (tts-1 or tts-1-hd, default settings.OPENAI_TTS_MODEL)
             speed: Speed (0.25 to 4.0)
             output_path: Optional path to save audio file
+            response_format: "mp3" or "pcm" (raw 24 kHz mono int16 LE,
+                no codec round trip - see PCM_SAMPLE_RATE)
             
         Returns:
-            Audio bytes (MP3 format)
+            Audio bytes (MP3 or raw PCM)
             
         Raises:
             Exception: If API call fails
         """
+        model = model or settings.OPENAI_TTS_MODEL
+        self._validate_request(voice, model, speed, response_format)
+
+        key = SpeechCache.make_key(
+            "openai", model, voice, speed, response_format, SpeechCache.normalize_text(text)
+        )
+
+        audio_bytes = await speech_cache.get(key)
+        if audio_bytes is not None:
+            _metrics.cache_hits += 1
+            logger.info(f"TTS cache hit: {len(text)} chars, voice={voice}, model={model}")
+        else:
+            audio_bytes = await _batcher.submit(self, key, text, voice, model, speed, response_format)
+
+        # Save to file if path provided
+        if output_path:
+            await asyncio.to_thread(self._save_output, output_path, audio_bytes)
+
+        return audio_bytes
+
+    async def generate_speech_to_file(
+        self,
+        text: str,
+        output_path: Path,
+        voice: str = "alloy",
+        model: Optional[str] = None,
+        speed: float = 1.0,
+        response_format: str = "mp3"
+    ) -> int:
+        """
+        Generate speech straight into output_path
+
+        Unlike generate_speech the audio never sits in memory: cache hits
+        are copied file-to-file and API responses are streamed to disk.
+        Requests are not coalesced with concurrent identical calls.
+
+        Returns:
+            Size of the written file in bytes
+        """
+        model = model or settings.OPENAI_TTS_MODEL
+        self._validate_request(voice, model, speed, response_format)
+
+        key = SpeechCache.make_key(
+            "openai", model, voice, speed, response_format, SpeechCache.normalize_text(text)
+        )
+
+        size = await speech_cache.copy_to(key, output_path)
+        if size is not None:
+            _metrics.cache_hits += 1
+            logger.info(f"TTS cache hit: {len(text)} chars, voice={voice}, model={model}")
+            return size
+
+        size = await self._request_speech_to_file(text, voice, model, speed, response_format, output_path)
+        await speech_cache.put_file(key, output_path, size)
+        return size
+
+    def _validate_request(self, voice: str, model: str, speed: float, response_format: str):
+        """Validate generation parameters (raises before any I/O)"""
         if not self.is_available():
             raise Exception("OpenAI API key not configured")
         
         # Validate inputs
-        if voice not in self.VOICES:
-            raise ValueError(f"Invalid voice: {voice}. Must be one of: {list(self.VOICES.keys())}")
+        if voice not in self._VOICES_FS:
+            raise ValueError(f"Invalid voice: {voice}. Must be one of: {self._VOICES_STR}")
         
-        if model not in self.MODELS:
-            raise ValueError(f"Invalid model: {model}. Must be one of: {list(self.MODELS.keys())}")
+        if model not in self._MODELS_FS:
+            raise ValueError(f"Invalid model: {model}. Must be one of: {self._MODELS_STR}")
         
         if not 0.25 <= speed <= 4.0:
             raise ValueError(f"Invalid speed: {speed}. Must be between 0.25 and 4.0")
         
-        logger.info(f"Generating speech with OpenAI: {len(text)} chars, voice={voice}, model={model}")
-        
+        if response_format not in self._FORMATS_FS:
+            raise ValueError(f"Invalid response_format: {response_format}. Must be one of: {self._FORMATS_STR}")
+
+    def _build_request(
+        self,
+        text: str,
+        voice: str,
+        model: str,
+        speed: float,
+        response_format: str
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """Encode the request body and headers"""
         # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
+        payload = _json_dumps({
             "model": model,
             "input": text,
             "voice": voice,
             "speed": speed,
-            "response_format": "mp3"
+            "response_format": response_format
+        })
+
+        # Same key on every retry, so a retry after a response we failed to
+        # read can't be billed or generated twice. Concurrent identical
+        # requests are already coalesced by OpenAITTSBatcher.
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Idempotency-Key": hashlib.sha256(payload).hexdigest()
         }
-        
-        # Make request with retry logic
-        max_retries = 3
-        retry_delay = 1.0
-        
-        for attempt in range(max_retries):
+        return payload, headers
+
+    def _check_breaker(self):
+        """Fail fast while the circuit breaker is open"""
+        if self._breaker_open():
+            raise Exception(
+                f"OpenAI TTS circuit open after {OpenAITTSService._breaker['fails']} "
+                "consecutive failures - try again later"
+            )
+
+    async def generate_speech_stream(
+        self,
+        text: str,
+        voice: str = "alloy",
+        model: Optional[str] = None,
+        speed: float = 1.0,
+        response_format: str = "mp3"
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech audio chunks as OpenAI produces them
+
+        Lets consumers (e.g. a FastAPI StreamingResponse) start playback on
+        the first frame. Cached audio is replayed from disk, and a completed
+        stream is added to the cache. There are no retries: once chunks
+        have been yielded a request can't be transparently restarted, so
+        callers that need retries should use generate_speech.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID (alloy, echo, fable, onyx, nova, shimmer)
+            model: Model to use (tts-1 or tts-1-hd, default settings.OPENAI_TTS_MODEL)
+            speed: Speed (0.25 to 4.0)
+            response_format: "mp3" or "pcm"
+
+        Yields:
+            Audio chunks
+        """
+        model = model or settings.OPENAI_TTS_MODEL
+        self._validate_request(voice, model, speed, response_format)
+
+        key = SpeechCache.make_key(
+            "openai", model, voice, speed, response_format, SpeechCache.normalize_text(text)
+        )
+        cached = await speech_cache.get(key)
+        if cached is not None:
+            _metrics.cache_hits += 1
+            for start in range(0, len(cached), self.STREAM_CHUNK_SIZE):
+                yield cached[start:start + self.STREAM_CHUNK_SIZE]
+            return
+
+        self._check_breaker()
+        logger.info(f"Streaming speech with OpenAI: {len(text)} chars, voice={voice}, model={model}")
+        payload, headers = self._build_request(text, voice, model, speed, response_format)
+
+        buffer = bytearray()
+        async with _request_limit:
+            _metrics.attempts += 1
+            _metrics.in_flight += 1
             try:
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    response = await client.post(
-                        self.BASE_URL,
-                        headers=headers,
-                        json=payload
-                    )
-                    
-                    if response.status_code == 200:
-                        audio_bytes = response.content
-                        
-                        # Save to file if path provided
-                        if output_path:
-                            output_path.parent.mkdir(parents=True, exist_ok=True)
-                            output_path.write_bytes(audio_bytes)
-                            logger.info(f"Saved audio to {output_path}")
-                        
-                        logger.info(f"Generated {len(audio_bytes)} bytes of audio")
-                        return audio_bytes
-                    else:
+                started = time.perf_counter()
+                ttfb = None
+                async with _get_http_client().stream(
+                    "POST",
+                    self.BASE_URL,
+                    headers=headers,
+                    content=payload
+                ) as response:
+                    if response.status_code != 200:
+                        await response.aread()
+                        _metrics.errors += 1
+                        if response.status_code >= 500:
+                            self._record_failure()
                         error_msg = f"OpenAI API error: {response.status_code} - {response.text}"
                         logger.error(error_msg)
-                        
-                        # Don't retry on client errors (4xx)
-                        if 400 <= response.status_code < 500:
-                            raise Exception(error_msg)
-                        
-                        # Retry on server errors (5xx)
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
-                            await asyncio.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                        else:
-                            raise Exception(error_msg)
-                            
+                        raise Exception(error_msg)
+
+                    async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                        if ttfb is None:
+                            ttfb = time.perf_counter() - started
+                        buffer += chunk
+                        yield chunk
+            except httpx.TransportError:
+                _metrics.errors += 1
+                self._record_failure()
+                raise
+            finally:
+                _metrics.in_flight -= 1
+
+        total = time.perf_counter() - started
+        _metrics.record_success(ttfb if ttfb is not None else total, total)
+        self._record_success()
+        await speech_cache.put(key, bytes(buffer))
+
+    async def generate_speech_chunked(
+        self,
+        text: str,
+        voice: str = "alloy",
+        model: Optional[str] = None,
+        speed: float = 1.0,
+        output_path: Optional[Path] = None,
+        max_chars: int = 500,
+        max_concurrent: int = 4,
+        response_format: str = "mp3"
+    ) -> bytes:
+        """
+        Generate speech for long text as parallel sentence-batched requests
+
+        The text is split on sentence boundaries and packed into chunks of
+        at most ``max_chars``; chunks are synthesized concurrently and the
+        audio concatenated in order (MP3 frames and raw PCM both
+        concatenate). Each chunk goes through generate_speech, so it is
+        cached individually.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID (alloy, echo, fable, onyx, nova, shimmer)
+            model: Model to use (tts-1 or tts-1-hd, default settings.OPENAI_TTS_MODEL)
+            speed: Speed (0.25 to 4.0)
+            output_path: Optional path to save audio file
+            max_chars: Maximum characters per request
+            max_concurrent: Maximum requests in flight
+            response_format: "mp3" or "pcm"
+
+        Returns:
+            Audio bytes in ``response_format`` (pcm is raw s16le)
+        """
+        chunks = self._split_text(text, max_chars)
+        if len(chunks) <= 1:
+            return await self.generate_speech(text, voice, model, speed, output_path, response_format)
+
+        logger.info(f"Generating speech in {len(chunks)} chunks ({len(text)} chars)")
+        limit = asyncio.Semaphore(max_concurrent)
+
+        async def generate_chunk(chunk: str) -> bytes:
+            async with limit:
+                return await self.generate_speech(chunk, voice, model, speed, response_format=response_format)
+
+        parts = await asyncio.gather(*(generate_chunk(c) for c in chunks))
+        audio_bytes = b"".join(parts)
+
+        if output_path:
+            await asyncio.to_thread(self._save_output, output_path, audio_bytes)
+
+        return audio_bytes
+
+    @staticmethod
+    def _save_output(output_path: Path, audio_bytes: bytes):
+        """Write audio to output_path (run in a worker thread)"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(audio_bytes)
+        logger.info(f"Saved audio to {output_path}")
+
+    @staticmethod
+    def _split_text(text: str, max_chars: int) -> List[str]:
+        """Greedily pack sentences into chunks of at most max_chars"""
+        chunks: List[str] = []
+        current = ""
+        for sentence in _SENTENCE_SPLIT_RE.split(text.strip()):
+            # Hard-wrap single sentences that are longer than a chunk
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                if cut <= 0:
+                    cut = max_chars
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+
+            if not sentence:
+                continue
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _generate_uncached(
+        self,
+        key: str,
+        text: str,
+        voice: str,
+        model: str,
+        speed: float,
+        response_format: str = "mp3"
+    ) -> bytes:
+        """Generate audio via the API and store it in the disk cache"""
+        audio_bytes = await self._request_speech(text, voice, model, speed, response_format)
+        await speech_cache.put(key, audio_bytes)
+        return audio_bytes
+
+    async def _request_speech(
+        self,
+        text: str,
+        voice: str,
+        model: str,
+        speed: float,
+        response_format: str = "mp3"
+    ) -> bytes:
+        """Call the OpenAI speech endpoint and return the audio bytes"""
+        buffer = bytearray()
+
+        async def write(chunk: bytes):
+            buffer.extend(chunk)
+
+        async def reset():
+            buffer.clear()
+
+        await self._stream_speech(text, voice, model, speed, response_format, write, reset)
+        return bytes(buffer)
+
+    async def _request_speech_to_file(
+        self,
+        text: str,
+        voice: str,
+        model: str,
+        speed: float,
+        response_format: str,
+        output_path: Path
+    ) -> int:
+        """
+        Call the OpenAI speech endpoint and stream the audio into output_path
+
+        Chunks go to a ``.part`` file as they arrive (renamed on success), so
+        the audio is never held in memory. Returns the file size.
+        """
+        size = await stream_to_file(
+            output_path,
+            lambda write, reset: self._stream_speech(
+                text, voice, model, speed, response_format, write, reset
+            )
+        )
+        logger.info(f"Saved audio to {output_path}")
+        return size
+
+    async def _stream_speech(
+        self,
+        text: str,
+        voice: str,
+        model: str,
+        speed: float,
+        response_format: str,
+        write: Callable[[bytes], Awaitable[None]],
+        reset: Callable[[], Awaitable[None]]
+    ) -> int:
+        """
+        Call the OpenAI speech endpoint with retry logic, passing each body
+        chunk to ``write``; ``reset`` discards a partial body before a retry.
+        Returns the number of bytes written.
+
+        Timeouts, transport errors, 429 and 5xx responses are retried with
+        full-jitter exponential backoff (or the server's Retry-After). Other
+        4xx responses fail immediately. Consecutive failures open a circuit
+        breaker shared by all instances, so calls fail fast during outages.
+        """
+        self._check_breaker()
+
+        logger.info(f"Generating speech with OpenAI: {len(text)} chars, voice={voice}, model={model}")
+
+        payload, headers = self._build_request(text, voice, model, speed, response_format)
+
+        error_msg = "Failed to generate speech after multiple retries"
+        for attempt in range(self.MAX_RETRIES):
+            retry_after = None
+            try:
+                # Stream the body straight to the sink instead of
+                # httpx's response.content plus a copy
+                async with _request_limit:
+                    _metrics.attempts += 1
+                    _metrics.in_flight += 1
+                    try:
+                        started = time.perf_counter()
+                        async with _get_http_client().stream(
+                            "POST",
+                            self.BASE_URL,
+                            headers=headers,
+                            content=payload
+                        ) as response:
+                            if response.status_code == 200:
+                                await reset()
+                                size = 0
+                                ttfb = None
+                                async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                                    if ttfb is None:
+                                        ttfb = time.perf_counter() - started
+                                    await write(chunk)
+                                    size += len(chunk)
+                                total = time.perf_counter() - started
+                                _metrics.record_success(ttfb if ttfb is not None else total, total)
+                                self._record_success()
+                                logger.info(
+                                    f"Generated {size} bytes of audio "
+                                    f"(ttfb={ttfb or total:.2f}s, total={total:.2f}s)"
+                                )
+                                return size
+
+                            await response.aread()
+                    finally:
+                        _metrics.in_flight -= 1
+
+                _metrics.errors += 1
+                error_msg = f"OpenAI API error: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+
+                # Don't retry on client errors (4xx) other than rate limiting
+                if response.status_code != 429 and 400 <= response.status_code < 500:
+                    raise Exception(error_msg)
+
+                if response.status_code >= 500:
+                    self._record_failure()
+                retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
             except httpx.TimeoutException:
+                _metrics.errors += 1
+                error_msg = "Request timed out after multiple retries"
                 logger.error("Request timed out")
-                if attempt < max_retries - 1:
-                    logger.warning(f"Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    raise Exception("Request timed out after multiple retries")
-            
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}")
-                if attempt < max_retries - 1 and not isinstance(e, ValueError):
-                    logger.warning(f"Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    raise
-        
-        raise Exception("Failed to generate speech after multiple retries")
-    
+                self._record_failure()
+            except httpx.TransportError as e:
+                _metrics.errors += 1
+                error_msg = f"OpenAI API connection error: {e}"
+                logger.error(error_msg)
+                self._record_failure()
+
+            if attempt == self.MAX_RETRIES - 1 or self._breaker_open():
+                break
+
+            # Full jitter: uniform in [0, base * 2^attempt], capped
+            delay = retry_after if retry_after is not None else random.uniform(
+                0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+            )
+            logger.warning(f"Retrying in {delay:.1f}s... (attempt {attempt + 1}/{self.MAX_RETRIES})")
+            _metrics.retries += 1
+            await asyncio.sleep(delay)
+
+        raise Exception(error_msg)
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date), capped at RETRY_MAX_DELAY"""
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.RETRY_MAX_DELAY)
+
+    @classmethod
+    def _breaker_open(cls) -> bool:
+        """
+        Check whether calls should fail fast
+
+        After the cooldown the breaker is half-open: the next call goes
+        through as a probe, and a single failure re-opens it.
+        """
+        opened_at = cls._breaker["opened_at"]
+        return bool(opened_at) and time.monotonic() - opened_at < cls.BREAKER_COOLDOWN_SECONDS
+
+    @classmethod
+    def _record_failure(cls):
+        """Count a failed call and open the breaker at the threshold"""
+        breaker = cls._breaker
+        breaker["fails"] += 1
+        if breaker["fails"] >= cls.BREAKER_FAILURE_THRESHOLD:
+            if not cls._breaker_open():
+                logger.warning(f"OpenAI TTS circuit opened after {breaker['fails']} consecutive failures")
+            breaker["opened_at"] = time.monotonic()
+
+    @classmethod
+    def _record_success(cls):
+        """Close the breaker after a successful call"""
+        cls._breaker["fails"] = 0
+        cls._breaker["opened_at"] = 0.0
+
+    async def warmup(self) -> bool:
+        """
+        Open a pooled connection to the API ahead of the first request
+
+        Issues a cheap authenticated GET so the TCP/TLS (and HTTP/2)
+        handshake is done before a user-facing generate_speech.
+
+        Returns:
+            True if the API answered
+        """
+        if not self.is_available():
+            return False
+
+        try:
+            response = await _get_http_client().get(
+                self.WARMUP_URL,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.WARMUP_TIMEOUT
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"OpenAI TTS warm-up failed: {e}")
+            return False
+
+        logger.info(f"OpenAI TTS connection warmed up (HTTP {response.status_code})")
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get OpenAI TTS metrics (shared across instances)
+
+        Returns:
+            Dictionary with counters, latency summaries and breaker state
+        """
+        return {
+            **_metrics.as_dict(),
+            "breaker_open": self._breaker_open(),
+            "consecutive_failures": OpenAITTSService._breaker["fails"],
+        }
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool"""
+        await close_pool("openai_tts")
+
     def calculate_cost(self, character_count: int, model: str = "tts-1-hd") -> float:
         """
         Calculate cost for text
@@ -11,7 +11,10 @@ COMPLETE END-TO-END PRODUCTION PIPELINE:
 Quality: 20/10 - Complete Enterprise System
 """
 
+import asyncio
 import logging
+import time
+from functools import cached_property
 from typing import Dict, Optional
 from datetime import datetime
 
@@ -25,6 +28,8 @@ from services.voice_production import (
     VoiceProfile,
     EmotionType
 )
+from services.voice_production.voice_engine import EmotionProfile
+from services.voice_production.audio_production import AudioTrack, PCM_S16LE
 
 logger = logging.getLogger(__name__)
 
@@ -42,23 +47,45 @@ class EnterprisePodcastOrchestrator:
     End-to-end production from topic → professional podcast
     """
 
-    def __init__(self):
-        # Initialize all enterprise modules
-        self.research_engine = EnterpriseResearchEngine()
-        self.narrative_engine = NarrativeEngine()
-        self.surprise_engine = SurpriseEngine()
-        self.emotion_director = EmotionDirector()
-        self.voice_engine = EnterpriseVoiceEngine()
-        self.audio_pipeline = AudioProductionPipeline()
+    # Max concurrent segment syntheses (keeps within provider rate limits)
+    SYNTHESIS_CONCURRENCY = 8
 
+    def __init__(self):
+        # Enterprise modules are created on first use (cached_property below),
+        # so engines a run never touches don't pay their init cost
         logger.info("🏢 Enterprise Podcast Orchestrator initialized")
-        logger.info("✅ All modules loaded")
+
+    @cached_property
+    def research_engine(self) -> EnterpriseResearchEngine:
+        return EnterpriseResearchEngine()
+
+    @cached_property
+    def narrative_engine(self) -> NarrativeEngine:
+        return NarrativeEngine()
+
+    @cached_property
+    def surprise_engine(self) -> SurpriseEngine:
+        return SurpriseEngine()
+
+    @cached_property
+    def emotion_director(self) -> EmotionDirector:
+        return EmotionDirector()
+
+    @cached_property
+    def voice_engine(self) -> EnterpriseVoiceEngine:
+        return EnterpriseVoiceEngine()
+
+    @cached_property
+    def audio_pipeline(self) -> AudioProductionPipeline:
+        return AudioProductionPipeline()
 
     async def produce_episode(self,
                              topic: str,
                              duration_minutes: int = 10,
                              audience: str = "general",
-                             depth: str = "comprehensive") -> Dict:
+                             depth: str = "comprehensive",
+                             max_segments: Optional[int] = None,
+                             audio_format: str = "mp3") -> Dict:
         """
         Produce complete podcast episode
 
@@ -67,6 +94,9 @@ class EnterprisePodcastOrchestrator:
             duration_minutes: Target duration
             audience: Target audience
             depth: Research depth (quick, standard, comprehensive, deep)
+            max_segments: Synthesize only the first N segments (None = all)
+            audio_format: "mp3" (segments joined as-is) or "wav" (segments
+                synthesized as int16 PCM and mixed without a codec round trip)
 
         Returns:
             Complete episode with audio, metadata, analytics
@@ -78,12 +108,21 @@ class EnterprisePodcastOrchestrator:
         logger.info(f"👥 Audience: {audience}")
         logger.info("="*80)
 
+        # One wall-clock reference; stage timings use the monotonic clock
+        # (immune to NTP adjustments) as ms since the start
+        wall_start = datetime.now()
+        t_start = time.monotonic()
+
+        def elapsed_ms() -> int:
+            return int((time.monotonic() - t_start) * 1000)
+
         production_metadata = {
             "topic": topic,
             "duration_minutes": duration_minutes,
             "audience": audience,
             "depth": depth,
-            "started_at": datetime.now().isoformat(),
+            "audio_format": audio_format,
+            "started_at": wall_start.isoformat(),
             "stages": {}
         }
 
@@ -101,7 +140,7 @@ class EnterprisePodcastOrchestrator:
         )
 
         production_metadata["stages"]["research"] = {
-            "completed_at": datetime.now().isoformat(),
+            "elapsed_ms": elapsed_ms(),
             "sources_count": sum(len(s) for s in research_report.sources.values()),
             "entities_count": len(research_report.entities),
             "confidence_scores": research_report.confidence_scores
@@ -126,7 +165,7 @@ class EnterprisePodcastOrchestrator:
         )
 
         production_metadata["stages"]["narrative"] = {
-            "completed_at": datetime.now().isoformat(),
+            "elapsed_ms": elapsed_ms(),
             "scenes_count": len(narrative_structure.scenes),
             "acts": [s.act for s in narrative_structure.scenes]
         }
@@ -136,10 +175,12 @@ class EnterprisePodcastOrchestrator:
         logger.info(f"   - Hook: {narrative_structure.hook[:50]}...")
 
         # ═══════════════════════════════════════════════════════════════
-        # STAGE 3: SURPRISE INJECTION
+        # STAGE 3 + 4: SURPRISE INJECTION & PERFORMANCE DIRECTION
         # ═══════════════════════════════════════════════════════════════
+        # Both only read the finished narrative, so they run concurrently
         logger.info("")
         logger.info("🎆 STAGE 3: SURPRISE INJECTION")
+        logger.info("🎬 STAGE 4: PERFORMANCE DIRECTION")
         logger.info("-" * 80)
 
         # Combine all narrative into one text for surprise analysis
@@ -149,37 +190,39 @@ class EnterprisePodcastOrchestrator:
             narrative_structure.resolution
         ])
 
-        surprises = await self.surprise_engine.generate_surprises(
-            narrative=full_narrative,
-            duration_minutes=duration_minutes
-        )
+        async def inject_surprises():
+            surprises = await self.surprise_engine.generate_surprises(
+                narrative=full_narrative,
+                duration_minutes=duration_minutes
+            )
 
-        production_metadata["stages"]["surprises"] = {
-            "completed_at": datetime.now().isoformat(),
-            "surprises_count": len(surprises)
-        }
+            production_metadata["stages"]["surprises"] = {
+                "elapsed_ms": elapsed_ms(),
+                "surprises_count": len(surprises)
+            }
 
-        logger.info(f"✅ Surprises generated: {len(surprises)}")
+            logger.info(f"✅ Surprises generated: {len(surprises)}")
+            return surprises
 
-        # ═══════════════════════════════════════════════════════════════
-        # STAGE 4: PERFORMANCE DIRECTION
-        # ═══════════════════════════════════════════════════════════════
-        logger.info("")
-        logger.info("🎬 STAGE 4: PERFORMANCE DIRECTION")
-        logger.info("-" * 80)
+        async def direct_performance():
+            performance_guide = await self.emotion_director.direct_performance(
+                script_text=full_narrative
+            )
 
-        performance_guide = await self.emotion_director.direct_performance(
-            script_text=full_narrative
-        )
+            production_metadata["stages"]["performance"] = {
+                "elapsed_ms": elapsed_ms(),
+                "instructions_count": len(performance_guide.instructions)
+            }
 
-        production_metadata["stages"]["performance"] = {
-            "completed_at": datetime.now().isoformat(),
-            "instructions_count": len(performance_guide.instructions)
-        }
+            logger.info(f"✅ Performance guide created:")
+            logger.info(f"   - Instructions: {len(performance_guide.instructions)}")
+            logger.info(f"   - Emotional arc: {performance_guide.overall_arc[:50]}...")
+            return performance_guide
 
-        logger.info(f"✅ Performance guide created:")
-        logger.info(f"   - Instructions: {len(performance_guide.instructions)}")
-        logger.info(f"   - Emotional arc: {performance_guide.overall_arc[:50]}...")
+        surprises, performance_guide = await asyncio.gather(
+            inject_surprises(),
+            direct_performance()
+        )
 
         # ═══════════════════════════════════════════════════════════════
         # STAGE 5: VOICE SYNTHESIS
@@ -195,11 +238,12 @@ class EnterprisePodcastOrchestrator:
             age_range="adult" if audience == "general" else "young"
         )
 
-        # Synthesize each segment with appropriate emotion
-        audio_segments = []
-        for instruction in performance_guide.instructions[:1]:  # Demo: just first segment
-            from services.voice_production.voice_engine import EmotionProfile
+        # Synthesize all segments concurrently (I/O-bound on the TTS provider);
+        # gather keeps results in instruction order
+        synthesis_limit = asyncio.Semaphore(self.SYNTHESIS_CONCURRENCY)
+        synthesis_format = "pcm" if audio_format == "wav" else "mp3"
 
+        async def synthesize_segment(instruction) -> bytes:
             emotion_profile = EmotionProfile(
                 primary_emotion=instruction.emotion,
                 energy_level=instruction.energy_level,
@@ -208,22 +252,48 @@ class EnterprisePodcastOrchestrator:
                 pauses=instruction.pauses
             )
 
-            audio_bytes = await self.voice_engine.synthesize(
-                text=instruction.segment_text,
-                voice_profile=voice_profile,
-                emotion_profile=emotion_profile
+            async with synthesis_limit:
+                return await self.voice_engine.synthesize(
+                    text=instruction.segment_text,
+                    voice_profile=voice_profile,
+                    emotion_profile=emotion_profile,
+                    output_format=synthesis_format
+                )
+
+        instructions = performance_guide.instructions
+        if max_segments is not None and len(instructions) > max_segments:
+            logger.warning(
+                f"⚠️  Synthesizing only {max_segments} of {len(instructions)} segments (max_segments)"
             )
+            instructions = instructions[:max_segments]
 
-            if audio_bytes:
-                from services.voice_production.audio_production import AudioTrack
-                audio_segments.append(AudioTrack(
+        segment_audio = await asyncio.gather(*(
+            synthesize_segment(instruction)
+            for instruction in instructions
+        ))
+
+        if synthesis_format == "pcm":
+            audio_segments = [
+                AudioTrack(
                     audio_data=audio_bytes,
-                    track_type="dialogue"
-                ))
+                    track_type="dialogue",
+                    sample_format=PCM_S16LE,
+                    sample_rate=self.voice_engine.PCM_SAMPLE_RATE
+                )
+                for audio_bytes in segment_audio
+                if audio_bytes
+            ]
+        else:
+            audio_segments = [
+                AudioTrack(audio_data=audio_bytes, track_type="dialogue")
+                for audio_bytes in segment_audio
+                if audio_bytes
+            ]
 
         production_metadata["stages"]["voice_synthesis"] = {
-            "completed_at": datetime.now().isoformat(),
+            "elapsed_ms": elapsed_ms(),
             "segments_synthesized": len(audio_segments),
+            "segments_total": len(performance_guide.instructions),
             "voice_used": voice_profile.name
         }
 
@@ -245,7 +315,7 @@ class EnterprisePodcastOrchestrator:
         )
 
         production_metadata["stages"]["audio_production"] = {
-            "completed_at": datetime.now().isoformat(),
+            "elapsed_ms": elapsed_ms(),
             "audio_size_kb": len(final_audio) / 1024 if final_audio else 0
         }
 
@@ -255,6 +325,7 @@ class EnterprisePodcastOrchestrator:
         # FINAL RESULT
         # ═══════════════════════════════════════════════════════════════
         production_metadata["completed_at"] = datetime.now().isoformat()
+        production_metadata["duration_ms"] = elapsed_ms()
 
         logger.info("")
         logger.info("=" * 80)
@@ -293,10 +364,29 @@ class EnterprisePodcastOrchestrator:
         }
 
 
+# Shared orchestrator, so engines (and their connection pools) are reused
+# across episodes
+_orchestrator: Optional[EnterprisePodcastOrchestrator] = None
+
+
+def get_orchestrator() -> EnterprisePodcastOrchestrator:
+    """
+    Get the shared orchestrator, creating it on first use
+
+    Construction is synchronous and never awaits, so no lock is needed
+    to keep concurrent callers on the event loop from creating two.
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = EnterprisePodcastOrchestrator()
+    return _orchestrator
+
+
 # Convenience function
 async def produce_enterprise_podcast(topic: str,
                                     duration_minutes: int = 10,
-                                    audience: str = "general") -> Dict:
+                                    audience: str = "general",
+                                    audio_format: str = "mp3") -> Dict:
     """
     Quick access to enterprise podcast production
 
@@ -304,9 +394,11 @@ async def produce_enterprise_podcast(topic: str,
         topic: Podcast topic
         duration_minutes: Target duration
         audience: Target audience
+        audio_format: "mp3" or "wav"
 
     Returns:
         Complete podcast with audio and metadata
     """
-    orchestrator = EnterprisePodcastOrchestrator()
-    return await orchestrator.produce_episode(topic, duration_minutes, audience)
+    return await get_orchestrator().produce_episode(
+        topic, duration_minutes, audience, audio_format=audio_format
+    )
@@ -5,8 +5,13 @@ Handles Voice Assignment, Segment Generation, Timeline Management
 
 import asyncio
 import logging
+import os
+import shutil
+import time
 import uuid
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -19,15 +24,80 @@ from services.openai_tts import OpenAITTSService
 from services.elevenlabs_tts import ElevenLabsTTSService
 from services.speechify_tts import SpeechifyTTSService
 from services.google_tts import GoogleTTSService
+from services.tts_cache import SpeechCache, speech_cache
 from core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Optional MP3 header parser - fall back to word-count estimates when missing
+try:
+    from mutagen import MutagenError
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
+
+
+@lru_cache(maxsize=256)
+def _job_paths(production_job_id: str) -> Tuple[Path, Path]:
+    """(output dir, segments dir) of a production; see _job_dirs to create them"""
+    output_dir = settings.PODCAST_OUTPUT_DIR / f"production_{production_job_id}"
+    return output_dir, output_dir / "segments"
+
+
+class _RateLimiter:
+    """Token bucket allowing `rate` acquisitions per second (bursts up to `rate`)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may start"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
 class ProductionService:
     """
     Complete podcast production pipeline
     """
 
+    # Providers whose service already caches by content (see OpenAITTSService)
+    _SELF_CACHING_PROVIDERS = frozenset({"openai"})
+
+    # Export encoding
+    _EXPORT_BITRATES = {"low": "96k", "medium": "128k", "high": "192k"}
+    _LOUDNORM_FILTER = "loudnorm=I=-16:TP=-1.5:LRA=11"  # -16 LUFS podcast target
+
+    # Bulkheads: max concurrent syntheses per provider across all
+    # productions, so one slow provider can't take every TTS slot
+    PROVIDER_CONCURRENCY = {
+        "openai": 8,
+        "elevenlabs": 4,
+        "speechify": 4,
+        "google": 16
+    }
+
+    # Request starts per second, kept under provider rate limits so bursts
+    # don't turn into 429s and backoff
+    PROVIDER_RPS = {
+        "openai": 8,
+        "elevenlabs": 4,
+        "speechify": 4,
+        "google": 8
+    }
+
+    # Speaking rate used for duration estimates (~150 words/min)
+    _WORDS_PER_SECOND = 2.5
+
     def __init__(self):
         """Initialize TTS services"""
         self.openai_tts = OpenAITTSService()
@@ -35,6 +105,39 @@ class ProductionService:
         self.speechify_tts = SpeechifyTTSService()
         self.google_tts = GoogleTTSService()
 
+        # Provider -> adapter coroutine (text, voice_id, speed, output_path) -> file size
+        self._providers = {
+            "openai": self._call_openai,
+            "elevenlabs": self._call_elevenlabs,
+            "speechify": self._call_speechify,
+            "google": self._call_google
+        }
+        self._bulkheads = {
+            provider: asyncio.BoundedSemaphore(limit)
+            for provider, limit in self.PROVIDER_CONCURRENCY.items()
+        }
+        self._rate_limits = {
+            provider: _RateLimiter(rps)
+            for provider, rps in self.PROVIDER_RPS.items()
+        }
+
+        # Bounded pool for blocking file work (MP3 probes, links, export I/O)
+        # so concurrent productions can't exhaust the default executor
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 4),
+            thread_name_prefix="production-io"
+        )
+
+    async def _run_io(self, func, *args):
+        """Run blocking file I/O on the service's thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, func, *args)
+
+    async def _job_dirs(self, production_job_id: str) -> Tuple[Path, Path]:
+        """(output dir, segments dir) of a production, (re)created if missing"""
+        output_dir, segments_dir = _job_paths(production_job_id)
+        await self._run_io(partial(segments_dir.mkdir, parents=True, exist_ok=True))
+        return output_dir, segments_dir
+
     async def create_production_from_research(
         self,
         research_job: ResearchJob,
@@ -87,6 +190,28 @@ class ProductionService:
         Returns:
             List of AudioSegment with generated audio
         """
+        audio_segments = [
+            segment async for segment in self.iter_segments(
+                production_job_id, script_segments, voice_assignments
+            )
+        ]
+
+        logger.info(f"Generated {len(audio_segments)} audio segments")
+        return audio_segments
+
+    async def iter_segments(
+        self,
+        production_job_id: str,
+        script_segments: List[Dict],
+        voice_assignments: List[VoiceAssignment]
+    ) -> AsyncIterator[AudioSegment]:
+        """
+        Generate audio for all segments, yielding each AudioSegment in
+        script order as soon as it and every segment before it are done
+
+        Syntheses run concurrently; callers can report progress or start
+        downstream work without waiting for the whole episode.
+        """
         logger.info(f"Generating {len(script_segments)} audio segments")
 
         # Create voice assignment map
@@ -95,14 +220,12 @@ class ProductionService:
             for assignment in voice_assignments
         }
 
-        audio_segments = []
-        output_dir = settings.PODCAST_OUTPUT_DIR / f"production_{production_job_id}" / "segments"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _, output_dir = await self._job_dirs(production_job_id)
 
+        # Plan jobs in script order
+        jobs = []
         for idx, seg in enumerate(script_segments, 1):
-            segment_id = str(uuid.uuid4())
             character_id = seg.get("speaker_id")
-            text = seg.get("text", "")
 
             # Get voice assignment
             assignment = voice_map.get(character_id)
@@ -110,22 +233,91 @@ class ProductionService:
                 logger.warning(f"No voice assignment for character {character_id}, skipping")
                 continue
 
-            try:
-                # Generate audio
-                output_path = output_dir / f"segment_{idx:03d}_{segment_id}.mp3"
-
-                audio_bytes = await self._generate_audio_for_segment(
-                    text=text,
-                    provider=assignment.provider,
-                    voice_id=assignment.voice_id,
-                    output_path=output_path
-                )
-
-                # Calculate duration (rough estimate)
-                duration = len(text.split()) / 2.5  # ~150 words/min
+            segment_id = str(uuid.uuid4())
+            output_path = output_dir / f"segment_{idx:03d}_{segment_id}.mp3"
+            jobs.append((idx, seg, segment_id, assignment, output_path))
+
+        # Repeated lines (intros, catchphrases, ad reads) with the same voice
+        # are synthesized once and linked into every segment that uses them
+        groups: Dict[Tuple[str, str, str], List[int]] = {}
+        for job_idx, (idx, seg, segment_id, assignment, output_path) in enumerate(jobs):
+            text = SpeechCache.normalize_text(seg.get("text", ""))
+            key = (assignment.provider, assignment.voice_id, text)
+            groups.setdefault(key, []).append(job_idx)
+
+        if len(groups) < len(jobs):
+            logger.info(f"Deduplicated {len(jobs) - len(groups)} repeated lines")
+
+        # TTS calls are network-bound: run them concurrently, capped by
+        # TTS_CONCURRENCY to respect provider rate limits
+        semaphore = asyncio.Semaphore(settings.TTS_CONCURRENCY)
+        results: List[Optional[Exception]] = [None] * len(jobs)
+        durations: List[Optional[float]] = [None] * len(jobs)
+
+        async def generate_group(job_indices: List[int]):
+            idx, seg, segment_id, assignment, output_path = jobs[job_indices[0]]
+            async with semaphore:
+                try:
+                    size = await self._generate_audio_for_segment(
+                        text=seg.get("text", ""),
+                        provider=assignment.provider,
+                        voice_id=assignment.voice_id,
+                        output_path=output_path
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to generate segment {idx}: {e}")
+                    for job_idx in job_indices:
+                        results[job_idx] = e
+                    return
+            logger.info(f"Segment {idx}/{len(script_segments)} generated: {size} bytes")
+
+            duration = await self._probe_duration(output_path)
+            for job_idx in job_indices:
+                durations[job_idx] = duration
+
+            for job_idx in job_indices[1:]:
+                duplicate_path = jobs[job_idx][4]
+                try:
+                    await self._run_io(self._link_or_copy, output_path, duplicate_path)
+                except OSError as e:
+                    logger.error(f"Failed to reuse audio for segment {jobs[job_idx][0]}: {e}")
+                    results[job_idx] = e
+
+        tasks = [None] * len(jobs)
+        for job_indices in groups.values():
+            task = asyncio.create_task(generate_group(job_indices))
+            for job_idx in job_indices:
+                tasks[job_idx] = task
+
+        # Yield segments in script order; a running cursor gives start/end
+        # times without re-summing earlier durations
+        cursor = 0.0
+        try:
+            for job_idx, (idx, seg, segment_id, assignment, output_path) in enumerate(jobs):
+                await tasks[job_idx]
+                error, duration = results[job_idx], durations[job_idx]
+                character_id = seg.get("speaker_id")
+                text = seg.get("text", "")
+
+                if error is not None:
+                    # Create error segment
+                    yield AudioSegment(
+                        segment_id=segment_id,
+                        segment_number=idx,
+                        segment_type=SegmentType.SPEECH,
+                        character_id=character_id,
+                        character_name=seg.get("speaker_name"),
+                        text=text,
+                        status="error",
+                        error_message=str(error)
+                    )
+                    continue
+
+                if duration is None:
+                    duration = self._estimate_duration(text)
 
                 # Create AudioSegment
-                audio_segment = AudioSegment(
+                yield AudioSegment(
                     segment_id=segment_id,
                     segment_number=idx,
                     segment_type=SegmentType.SPEECH,
@@ -137,75 +329,136 @@ class ProductionService:
                     provider=assignment.provider,
                     speed=1.0,
                     volume=1.0,
-                    start_time=sum(s.duration for s in audio_segments),
+                    start_time=cursor,
                     duration=duration,
-                    end_time=sum(s.duration for s in audio_segments) + duration,
+                    end_time=cursor + duration,
                     audio_url=f"/api/production/audio/{production_job_id}/{segment_id}",
                     audio_path=str(output_path),
                     status="ready"
                 )
+                cursor += duration
+        finally:
+            # Consumer stopped early (or failed): don't leave syntheses running
+            for task in tasks:
+                task.cancel()
 
-                audio_segments.append(audio_segment)
-                logger.info(f"Segment {idx}/{len(script_segments)} generated: {len(audio_bytes)} bytes")
+    async def _generate_audio_for_segment(
+        self,
+        text: str,
+        provider: str,
+        voice_id: str,
+        output_path: Path,
+        speed: float = 1.0
+    ) -> int:
+        """
+        Generate audio for single segment into output_path
 
-            except Exception as e:
-                logger.error(f"Failed to generate segment {idx}: {e}")
-                # Create error segment
-                audio_segment = AudioSegment(
-                    segment_id=segment_id,
-                    segment_number=idx,
-                    segment_type=SegmentType.SPEECH,
-                    character_id=character_id,
-                    character_name=seg.get("speaker_name"),
-                    text=text,
-                    status="error",
-                    error_message=str(e)
-                )
-                audio_segments.append(audio_segment)
+        Lines already synthesized with the same provider, voice and speed
+        (regenerations, lines shared across productions) are served from
+        the shared TTS cache instead of a paid API call. Only the file size
+        is returned, so finished segments don't stay in memory.
+        """
+        if provider in self._SELF_CACHING_PROVIDERS:
+            return await self._synthesize_segment(text, provider, voice_id, output_path, speed)
 
-        logger.info(f"Generated {len(audio_segments)} audio segments")
-        return audio_segments
+        key = SpeechCache.make_key(
+            provider, voice_id, self._effective_speed(provider, speed), SpeechCache.normalize_text(text)
+        )
+        size = await speech_cache.copy_to(key, output_path)
+        if size is not None:
+            logger.info(f"TTS cache hit for {provider}/{voice_id}: {len(text)} chars")
+            return size
+
+        size = await self._synthesize_segment(text, provider, voice_id, output_path, speed)
+        if size:
+            await speech_cache.put_file(key, output_path, size)
+        return size
+
+    async def _probe_duration(self, path: Path) -> Optional[float]:
+        """Exact duration of an MP3 file from its headers, or None if it can't be read"""
+        if MP3 is None:
+            return None
+        try:
+            return await self._run_io(lambda: MP3(str(path)).info.length)
+        except (MutagenError, OSError) as e:
+            logger.warning(f"Could not read duration of {path.name}: {e}")
+            return None
+
+    @classmethod
+    def _estimate_duration(cls, text: str) -> float:
+        """Rough spoken duration of text in seconds"""
+        return len(text.split()) / cls._WORDS_PER_SECOND
+
+    @staticmethod
+    def _effective_speed(provider: str, speed: float) -> float:
+        """
+        Speed as the provider actually renders it, so cache keys don't split
+        identical audio: ElevenLabs ignores speed, gTTS only has normal/slow
+        """
+        if provider == "elevenlabs":
+            return 1.0
+        if provider == "google":
+            return 0.5 if speed < 0.75 else 1.0
+        return speed
+
+    @staticmethod
+    def _link_or_copy(src: Path, dest: Path):
+        """Hardlink src to dest, copying when linking isn't possible (e.g. across filesystems)"""
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copyfile(src, dest)
 
-    async def _generate_audio_for_segment(
+    async def _synthesize_segment(
         self,
         text: str,
         provider: str,
         voice_id: str,
         output_path: Path,
-        speed: float = 1.0
-    ) -> bytes:
-        """Generate audio for single segment"""
-
-        if provider == "openai":
-            return await self.openai_tts.generate_speech(
-                text=text,
-                voice=voice_id,
-                speed=speed,
-                output_path=output_path
-            )
-        elif provider == "elevenlabs":
-            return await self.elevenlabs_tts.generate_speech(
-                text=text,
-                voice_id=voice_id,
-                output_path=output_path
-            )
-        elif provider == "speechify":
-            return await self.speechify_tts.generate_speech(
-                text=text,
-                voice=voice_id,
-                speed=speed,
-                output_path=output_path
-            )
-        elif provider == "google":
-            return await self.google_tts.generate_speech(
-                text=text,
-                voice=voice_id,
-                speed=speed,
-                output_path=output_path
-            )
-        else:
+        speed: float
+    ) -> int:
+        """Call the provider's TTS service; returns the written file size"""
+        synthesize = self._providers.get(provider)
+        if synthesize is None:
             raise ValueError(f"Unknown provider: {provider}")
 
+        async with self._bulkheads[provider]:
+            await self._rate_limits[provider].acquire()
+            return await synthesize(text, voice_id, speed, output_path)
+
+    async def _call_openai(self, text: str, voice_id: str, speed: float, output_path: Path) -> int:
+        # Streams the response to disk instead of buffering it
+        return await self.openai_tts.generate_speech_to_file(
+            text=text,
+            output_path=output_path,
+            voice=voice_id,
+            speed=speed
+        )
+
+    async def _call_elevenlabs(self, text: str, voice_id: str, speed: float, output_path: Path) -> int:
+        return await self.elevenlabs_tts.generate_speech_to_file(
+            text=text,
+            output_path=output_path,
+            voice_id=voice_id
+        )
+
+    async def _call_speechify(self, text: str, voice_id: str, speed: float, output_path: Path) -> int:
+        return await self.speechify_tts.generate_speech_to_file(
+            text=text,
+            output_path=output_path,
+            voice=voice_id,
+            speed=speed
+        )
+
+    async def _call_google(self, text: str, voice_id: str, speed: float, output_path: Path) -> int:
+        audio_bytes = await self.google_tts.generate_speech(
+            text=text,
+            voice=voice_id,
+            speed=speed,
+            output_path=output_path
+        )
+        return len(audio_bytes)
+
     def create_timeline(
         self,
         production_job_id: str,
@@ -227,7 +480,7 @@ class ProductionService:
             track_name="Speech",
             track_type="speech",
             track_number=1,
-            segments=audio_segments,
+            segments=tuple(audio_segments),
             volume=1.0
         )
 
@@ -237,7 +490,7 @@ class ProductionService:
             track_name="Background Music",
             track_type="music",
             track_number=2,
-            segments=[],
+            segments=(),
             volume=0.3
         )
 
@@ -247,7 +500,7 @@ class ProductionService:
             track_name="Sound Effects",
             track_type="sfx",
             track_number=3,
-            segments=[],
+            segments=(),
             volume=0.5
         )
 
@@ -283,13 +536,12 @@ class ProductionService:
         Returns:
             Updated AudioSegment with new audio
         """
-        output_dir = settings.PODCAST_OUTPUT_DIR / f"production_{production_job_id}" / "segments"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _, output_dir = await self._job_dirs(production_job_id)
 
         output_path = output_dir / f"segment_{segment.segment_number:03d}_{segment.segment_id}_v2.mp3"
 
         try:
-            audio_bytes = await self._generate_audio_for_segment(
+            await self._generate_audio_for_segment(
                 text=segment.text or "",
                 provider=segment.provider or "openai",
                 voice_id=segment.voice_id or "alloy",
@@ -298,6 +550,10 @@ class ProductionService:
             )
 
             # Update segment
+            duration = await self._probe_duration(output_path)
+            if duration is not None:
+                segment.duration = duration
+                segment.end_time = segment.start_time + duration
             segment.audio_path = str(output_path)
             segment.audio_url = f"/api/production/audio/{production_job_id}/{segment.segment_id}"
             segment.status = "ready"
@@ -335,14 +591,10 @@ class ProductionService:
         """
         logger.info(f"Exporting final podcast: {production_job_id}")
 
-        output_dir = settings.PODCAST_OUTPUT_DIR / f"production_{production_job_id}"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir, _ = await self._job_dirs(production_job_id)
 
         output_path = output_dir / f"final_podcast.{format}"
 
-        # TODO: Implement audio merging with pydub/ffmpeg
-        # For now, just concatenate speech segments
-
         try:
             # Collect all speech segments in order
             speech_track = next(
@@ -353,27 +605,20 @@ class ProductionService:
             if not speech_track or not speech_track.segments:
                 raise ValueError("No speech segments found")
 
-            # Sort segments by segment_number
+            # Sort segments by segment_number - timeline edits can reorder
+            # them, and Timsort is linear on already-ordered input
             sorted_segments = sorted(
                 speech_track.segments,
                 key=lambda s: s.segment_number
             )
 
-            # Placeholder: Just copy first segment as "final" for now
-            # In production, use pydub to merge:
-            # from pydub import AudioSegment
-            # combined = AudioSegment.empty()
-            # for seg in sorted_segments:
-            #     audio = AudioSegment.from_file(seg.audio_path)
-            #     combined += audio
-            # combined.export(output_path, format=format)
-
-            first_segment_path = Path(sorted_segments[0].audio_path)
-            if first_segment_path.exists():
-                import shutil
-                shutil.copy(first_segment_path, output_path)
-
-            file_size = output_path.stat().st_size
+            segment_paths = await self._run_io(self._existing_audio_paths, sorted_segments)
+            if not segment_paths:
+                raise ValueError("No generated speech segments to export")
+
+            await self._merge_segments(segment_paths, output_path, format, quality, normalize)
+
+            file_size = await self._run_io(os.path.getsize, output_path)
             duration = timeline.total_duration
 
             logger.info(f"Exported final podcast: {file_size} bytes, {duration:.2f}s")
@@ -383,3 +628,90 @@ class ProductionService:
         except Exception as e:
             logger.error(f"Export failed: {e}")
             raise
+
+    async def _merge_segments(
+        self,
+        segment_paths: List[Path],
+        output_path: Path,
+        format: str,
+        quality: str,
+        normalize: bool
+    ):
+        """
+        Merge segment files with ffmpeg's concat demuxer
+
+        MP3 without normalization is stream-copied (no decode/re-encode,
+        bit-exact frames). Other formats, or normalization, re-encode once
+        with loudnorm applied in the same ffmpeg pass.
+        """
+        if not shutil.which("ffmpeg"):
+            if format != "mp3":
+                raise RuntimeError("ffmpeg is required to export non-MP3 formats")
+            # MP3 frames concatenate; loudness normalization needs ffmpeg
+            logger.warning("ffmpeg not found - concatenating MP3 segments without normalization")
+            await self._run_io(self._concat_files, segment_paths, output_path)
+            return
+
+        if format == "mp3" and not normalize:
+            codec_args = ["-c", "copy"]
+        else:
+            codec_args = ["-af", self._LOUDNORM_FILTER] if normalize else []
+            if format == "wav":
+                codec_args += ["-c:a", "pcm_s16le"]
+            else:
+                codec_args += ["-c:a", "libmp3lame", "-b:a", self._EXPORT_BITRATES.get(quality, "192k")]
+
+        # The concat list goes to ffmpeg's stdin - no temporary list file
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-protocol_whitelist", "file,pipe",
+            "-i", "pipe:0",
+            *codec_args,
+            str(output_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate(self._concat_list(segment_paths))
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg failed ({process.returncode}): {stderr.decode(errors='replace')[-500:]}"
+            )
+
+    @staticmethod
+    def _existing_audio_paths(segments: List[AudioSegment]) -> List[Path]:
+        """Audio files of ready segments that exist on disk"""
+        return [
+            Path(seg.audio_path)
+            for seg in segments
+            if seg.status == "ready" and seg.audio_path and Path(seg.audio_path).exists()
+        ]
+
+    @staticmethod
+    def _concat_list(segment_paths: List[Path]) -> bytes:
+        """ffmpeg concat demuxer list (absolute paths, single quotes escaped)"""
+        return "".join(
+            "file '{}'\n".format(os.path.abspath(p).replace("'", "'\\''"))
+            for p in segment_paths
+        ).encode("utf-8")
+
+    @staticmethod
+    def _concat_files(segment_paths: List[Path], output_path: Path):
+        """Append segment files to output_path, in-kernel via sendfile where supported"""
+        with open(output_path, "wb") as out:
+            for path in segment_paths:
+                with open(path, "rb") as src:
+                    offset = 0
+                    try:
+                        size = os.fstat(src.fileno()).st_size
+                        while offset < size:
+                            sent = os.sendfile(out.fileno(), src.fileno(), offset, size - offset)
+                            if sent == 0:
+                                break
+                            offset += sent
+                    except (AttributeError, OSError):
+                        # No sendfile on this platform/filesystem: finish in userspace
+                        src.seek(offset)
+                        out.seek(0, os.SEEK_END)
+                        shutil.copyfileobj(src, out)
@@ -7,6 +7,9 @@ import asyncio
 import logging
 import json
 import random
+import re
+import time
+from collections import OrderedDict
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
@@ -25,6 +28,14 @@ from core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _bullets(items: List[str]) -> str:
+    """Render items as a newline-separated bullet list"""
+    return "\n".join(f"- {item}" for item in items)
+
+
 class PodcastResearchService:
     """
     Complete podcast research and generation service
@@ -37,6 +48,26 @@ class PodcastResearchService:
     - Stage 5: Knowledge integration
     """
 
+    RESULT_CACHE_MAX_ENTRIES = 200
+    RESULT_CACHE_TTL_SECONDS = 3600.0
+
+    # (name, personality) for guests, assigned in order
+    _GUEST_PROFILES = (
+        ("Dr. Sarah", "wissenschaftlich präzise, aber zugänglich"),
+        ("Michael", "praxiserfahren, storyteller"),
+        ("Prof. Klein", "akademisch fundiert, kritisch"),
+        ("Emma", "innovativ denkend, visionär"),
+    )
+
+    # Audiences a script variant is generated for, in presentation order
+    _AUDIENCES = (AudienceType.YOUNG, AudienceType.MIDDLE_AGED, AudienceType.SCIENTIFIC)
+
+    _TONES = {
+        AudienceType.YOUNG: "locker, humorvoll, energiegeladen",
+        AudienceType.MIDDLE_AGED: "ausgewogen, informativ und unterhaltsam",
+        AudienceType.SCIENTIFIC: "präzise, faktenbasiert, akademisch"
+    }
+
     def __init__(self, use_intelligent_pipeline: bool = True):
         """Initialize research service
 
@@ -47,6 +78,8 @@ class PodcastResearchService:
         self.intelligent_pipeline = IntelligentResearchPipeline() if use_intelligent_pipeline else None
         self.use_intelligent = use_intelligent_pipeline
         self._pipeline_result = None  # Cache pipeline result for script generation
+        # request fingerprint -> (stored_at, research_result, variants, recommended, reason), LRU ordered
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
 
     async def execute_research(self, request: ResearchRequest) -> tuple[ResearchResult, List[ScriptVariant], AudienceType, str]:
         """
@@ -60,6 +93,12 @@ class PodcastResearchService:
         """
         logger.info(f"Starting research for topic: {request.topic}")
 
+        key = self._request_fingerprint(request)
+        cached = self._get_cached_result(key)
+        if cached is not None:
+            logger.info(f"Research cache hit for topic: {request.topic}")
+            return cached
+
         # Step 1: Multi-source research
         research_result = await self._perform_research(request)
 
@@ -84,8 +123,62 @@ class PodcastResearchService:
 
         logger.info(f"Research completed: {len(variants)} variants, recommended: {recommended}")
 
+        # Degraded runs are not cached so the next request retries the sources
+        if variants and research_result.data_quality != "fallback":
+            self._store_cached_result(key, (research_result, variants, recommended, reason))
+
         return research_result, variants, recommended, reason
 
+    @staticmethod
+    def _request_fingerprint(request: ResearchRequest) -> tuple:
+        """
+        Build the cache key for a research request
+
+        The topic is compared case- and whitespace-insensitively; every other
+        request field must match exactly.
+        """
+        topic = " ".join(request.topic.split()).casefold()
+        options = request.model_dump(exclude={"topic"})
+        return (topic, tuple(sorted(options.items())))
+
+    def _get_cached_result(self, key: tuple) -> Optional[tuple]:
+        """
+        Look up a previous research run
+
+        Returns:
+            Deep copy of (research_result, variants, recommended, reason), or None
+        """
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, research_result, variants, recommended, reason = entry
+        if time.monotonic() - stored_at >= self.RESULT_CACHE_TTL_SECONDS:
+            del self._result_cache[key]
+            return None
+
+        self._result_cache.move_to_end(key)
+        return (
+            research_result.model_copy(deep=True),
+            [variant.model_copy(deep=True) for variant in variants],
+            recommended,
+            reason,
+        )
+
+    def _store_cached_result(self, key: tuple, result: tuple) -> None:
+        """Store a private copy of a research run, evicting the oldest entry"""
+        research_result, variants, recommended, reason = result
+        self._result_cache[key] = (
+            time.monotonic(),
+            research_result.model_copy(deep=True),
+            [variant.model_copy(deep=True) for variant in variants],
+            recommended,
+            reason,
+        )
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
     async def _perform_research(self, request: ResearchRequest) -> ResearchResult:
         """
         Perform multi-source research
@@ -106,29 +199,51 @@ class PodcastResearchService:
         warnings: List[str] = []
         mcp_used = False
 
+        # Sub-researches are independent - run them concurrently, so the
+        # total time is that of the slowest source instead of the sum
+        research = {}
+
         # YouTube research (if enabled)
         if request.include_youtube and settings.MCP_YOUTUBE_ENABLED:
-            youtube_sources = await self._research_youtube(request.topic)
-            if youtube_sources:
-                sources.extend(youtube_sources)
-                mcp_used = True
-            else:
-                warnings.append("YouTube research unavailable - limited video insights")
+            research["youtube"] = self._research_youtube(request.topic)
 
         # Podcast research (best practices)
         if request.include_podcasts:
-            podcast_sources = await self._research_podcasts(request.topic)
-            sources.extend(podcast_sources)
+            research["podcasts"] = self._research_podcasts(request.topic)
 
         # Web search (general + scientific)
         if request.include_scientific or request.include_everyday:
-            web_sources = await self._research_web(
+            research["web"] = self._research_web(
                 topic=request.topic,
                 scientific=request.include_scientific,
                 everyday=request.include_everyday
             )
-            if web_sources:
-                sources.extend(web_sources)
+
+        results = dict(zip(
+            research,
+            await asyncio.gather(*research.values(), return_exceptions=True)
+        ))
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                logger.error(f"{name} research failed: {result}")
+                results[name] = []
+
+        if "youtube" in results:
+            if results["youtube"]:
+                sources.extend(results["youtube"])
+                mcp_used = True
+            else:
+                warnings.append("YouTube research unavailable - limited video insights")
+
+        if "podcasts" in results:
+            if results["podcasts"]:
+                sources.extend(results["podcasts"])
+            else:
+                warnings.append("Podcast research unavailable - limited format insights")
+
+        if "web" in results:
+            if results["web"]:
+                sources.extend(results["web"])
                 mcp_used = True
             else:
                 if request.include_scientific:
@@ -145,10 +260,10 @@ class PodcastResearchService:
             data_quality = "partial" if len(sources) > 0 else "fallback"
 
         # Get Claude analysis
-        sources_summary = "\n\n".join([
+        sources_summary = "\n\n".join(
             f"[{s.source_type.upper()}] {s.title}\n{s.summary}\nKey Points: {', '.join(s.key_insights[:3])}"
             for s in sources
-        ])
+        )
 
         try:
             claude_analysis = await self.claude.research_topic(
@@ -279,54 +394,52 @@ class PodcastResearchService:
         #     logger.error(f"Web MCP research failed: {e}", exc_info=True)
         # return sources
 
-    def _generate_characters(self, num_guests: int, include_listener: bool) -> List[Dict]:
-        """Generate podcast characters"""
+    def _generate_characters(self, num_guests: int, include_listener: bool) -> List[PodcastCharacter]:
+        """
+        Generate podcast characters
+
+        The data is built here from trusted constants, so the models are
+        constructed without re-running validation.
+        """
         characters = []
 
         # Host (always present)
-        host = {
-            "id": "host_1",
-            "name": "Alex",
-            "role": "host",
-            "personality": "neugierig, humorvoll, moderiert geschickt",
-            "expertise": "Podcast-Moderation",
-            "speech_style": "locker und einladend",
-            "dominance_level": 0.4
-        }
+        host = PodcastCharacter.model_construct(
+            id="host_1",
+            name="Alex",
+            role=CharacterType.HOST,
+            personality="neugierig, humorvoll, moderiert geschickt",
+            expertise="Podcast-Moderation",
+            speech_style="locker und einladend",
+            dominance_level=0.4
+        )
         characters.append(host)
 
         # Guests
-        guest_names = ["Dr. Sarah", "Michael", "Prof. Klein", "Emma"]
-        guest_personalities = [
-            "wissenschaftlich präzise, aber zugänglich",
-            "praxiserfahren, storyteller",
-            "akademisch fundiert, kritisch",
-            "innovativ denkend, visionär"
-        ]
-
         for i in range(num_guests):
-            guest = {
-                "id": f"guest_{i+1}",
-                "name": guest_names[i % len(guest_names)],
-                "role": "guest",
-                "personality": guest_personalities[i % len(guest_personalities)],
-                "expertise": "Fachexpertise",
-                "speech_style": "informativ aber unterhaltsam",
-                "dominance_level": 0.5 + random.uniform(-0.1, 0.1)
-            }
+            name, personality = self._GUEST_PROFILES[i % len(self._GUEST_PROFILES)]
+            guest = PodcastCharacter.model_construct(
+                id=f"guest_{i+1}",
+                name=name,
+                role=CharacterType.GUEST,
+                personality=personality,
+                expertise="Fachexpertise",
+                speech_style="informativ aber unterhaltsam",
+                dominance_level=0.5 + random.uniform(-0.1, 0.1)
+            )
             characters.append(guest)
 
         # Listener (side topics)
         if include_listener:
-            listener = {
-                "id": "listener_1",
-                "name": "Hörer-Frage",
-                "role": "listener",
-                "personality": "neugierig, bringt Außensicht",
-                "expertise": None,
-                "speech_style": "fragend, interessiert",
-                "dominance_level": 0.15
-            }
+            listener = PodcastCharacter.model_construct(
+                id="listener_1",
+                name="Hörer-Frage",
+                role=CharacterType.LISTENER,
+                personality="neugierig, bringt Außensicht",
+                expertise=None,
+                speech_style="fragend, interessiert",
+                dominance_level=0.15
+            )
             characters.append(listener)
 
         return characters
@@ -335,7 +448,7 @@ class PodcastResearchService:
         self,
         request: ResearchRequest,
         research_result: ResearchResult,
-        characters: List[Dict]
+        characters: List[PodcastCharacter]
     ) -> List[ScriptVariant]:
         """Generate 3 script variants for different audiences
 
@@ -355,10 +468,10 @@ class PodcastResearchService:
 Topic: {request.topic}
 
 Key Findings:
-{chr(10).join([f"- {f}" for f in research_result.key_findings[:10]])}
+{_bullets(research_result.key_findings[:10])}
 
 Suggested Structure:
-{chr(10).join([f"- {s}" for s in research_result.suggested_structure])}
+{_bullets(research_result.suggested_structure)}
 
 Sources: {research_result.total_sources} sources analyzed
 Quality Score: {research_result.estimated_quality_score}/10
@@ -372,65 +485,103 @@ Quality Score: {research_result.estimated_quality_score}/10
                 if isinstance(hook_potential, dict):
                     research_summary += f"\n\nHOOK POTENTIAL:\n{str(hook_potential)[:500]}"
 
-        variants = []
-
-        for audience in [AudienceType.YOUNG, AudienceType.MIDDLE_AGED, AudienceType.SCIENTIFIC]:
-            try:
-                # Use optimized research summary if we have pipeline insights
-                final_research_summary = research_summary
-                if optimized_prompt:
-                    # Prepend optimized prompt guidance to research summary
-                    final_research_summary = f"""OPTIMIZED GUIDANCE:
+        # Use optimized research summary if we have pipeline insights
+        final_research_summary = research_summary
+        if optimized_prompt:
+            # Prepend optimized prompt guidance to research summary
+            final_research_summary = f"""OPTIMIZED GUIDANCE:
 {optimized_prompt}
 
 RESEARCH DATA:
 {research_summary}"""
 
-                script_text = await self.claude.generate_podcast_script(
-                    topic=request.topic,
-                    research_findings=final_research_summary,
-                    audience=audience.value,
-                    duration_minutes=request.target_duration_minutes,
-                    characters=characters,
-                    spontaneous=request.spontaneous_deviations,
-                    randomness=request.randomness_level
-                )
+        # All variants use the same speaker labels - resolve them once
+        speaker_ids: Dict[str, str] = {}
 
-                # Parse script into segments
-                segments = self._parse_script_segments(script_text, characters)
-
-                variant = ScriptVariant(
-                    audience=audience,
-                    title=f"{request.topic} - {audience.value.replace('_', ' ').title()}",
-                    description=f"Podcast für {audience.value.replace('_', ' ')} Zielgruppe",
-                    characters=[
-                        PodcastCharacter(**c) for c in characters
-                    ],
-                    segments=segments,
-                    total_duration_minutes=request.target_duration_minutes,
-                    word_count=len(script_text.split()),
-                    tone=self._get_tone_description(audience),
-                    full_script=script_text
-                )
+        async def generate_variant(audience: AudienceType) -> ScriptVariant:
+            script_text = await self.claude.generate_podcast_script(
+                topic=request.topic,
+                research_findings=final_research_summary,
+                audience=audience.value,
+                duration_minutes=request.target_duration_minutes,
+                characters=characters,
+                spontaneous=request.spontaneous_deviations,
+                randomness=request.randomness_level
+            )
+
+            # Parse script into segments
+            segments = self._parse_script_segments(script_text, characters, speaker_ids)
+
+            variant = ScriptVariant(
+                audience=audience,
+                title=f"{request.topic} - {audience.value.replace('_', ' ').title()}",
+                description=f"Podcast für {audience.value.replace('_', ' ')} Zielgruppe",
+                characters=characters,
+                segments=segments,
+                total_duration_minutes=request.target_duration_minutes,
+                word_count=len(script_text.split()),
+                tone=self._get_tone_description(audience),
+                full_script=script_text
+            )
+
+            logger.info(f"Generated variant for {audience.value}: {variant.word_count} words")
+            return variant
 
-                variants.append(variant)
-                logger.info(f"Generated variant for {audience.value}: {variant.word_count} words")
+        # The three Claude calls are independent - run them concurrently
+        results = await asyncio.gather(
+            *(generate_variant(audience) for audience in self._AUDIENCES),
+            return_exceptions=True
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to generate variant for {audience}: {e}")
+        variants = []
+        for audience, result in zip(self._AUDIENCES, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to generate variant for {audience}: {result}")
                 # Continue with other variants
+                continue
+            variants.append(result)
 
         return variants
 
-    def _parse_script_segments(self, script: str, characters: List[Dict]) -> List[ConversationSegment]:
-        """Parse script text into conversation segments"""
+    def _parse_script_segments(
+        self,
+        script: str,
+        characters: List[PodcastCharacter],
+        speaker_ids: Optional[Dict[str, str]] = None
+    ) -> List[ConversationSegment]:
+        """
+        Parse script text into conversation segments (single pass over the script)
+
+        Args:
+            script: Generated script text
+            characters: Characters the script was written for
+            speaker_ids: Optional speaker label -> character ID memo, shared
+                between scripts written for the same characters
+
+        Returns:
+            Conversation segments in script order
+        """
         segments = []
-        lines = script.split("\n")
+
+        # Speaker labels repeat on every line - resolve each label once
+        character_names = [(c.name.lower(), c.id) for c in characters]
+        if speaker_ids is None:
+            speaker_ids = {}
+
+        # A line is spontaneous if a [SPONTAN marker ends within the 100
+        # characters before it; markers are consumed in script order
+        markers = [m.start() for m in re.finditer(r"\[SPONTAN", script)]
+        marker_idx = 0
+        last_marker = None
 
         segment_num = 1
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("[") or line.startswith("#"):
+        pos = 0
+        for raw_line in script.split("\n"):
+            line_start = pos
+            pos += len(raw_line) + 1
+
+            line = raw_line.strip()
+            if not line or line[0] in "[#":
                 continue
 
             # Try to parse "Name: dialogue"
@@ -440,15 +591,24 @@ RESEARCH DATA:
                 text = parts[1].strip()
 
                 # Find character ID
-                speaker_id = next(
-                    (c["id"] for c in characters if c["name"].lower() in speaker_name.lower()),
-                    "unknown"
-                )
+                speaker_id = speaker_ids.get(speaker_name)
+                if speaker_id is None:
+                    speaker_lower = speaker_name.lower()
+                    speaker_id = next(
+                        (char_id for name, char_id in character_names if name in speaker_lower),
+                        "unknown"
+                    )
+                    speaker_ids[speaker_name] = speaker_id
 
                 # Check if spontaneous
-                is_spontan = "[SPONTAN" in script[max(0, script.find(line) - 100):script.find(line)]
-
-                segment = ConversationSegment(
+                content_start = line_start + (len(raw_line) - len(raw_line.lstrip()))
+                while marker_idx < len(markers) and markers[marker_idx] + 8 <= content_start:
+                    last_marker = markers[marker_idx]
+                    marker_idx += 1
+                is_spontan = last_marker is not None and last_marker >= content_start - 100
+
+                # Every field is produced by this parser with the right type
+                segment = ConversationSegment.model_construct(
                     segment_number=segment_num,
                     speaker_id=speaker_id,
                     speaker_name=speaker_name,
@@ -464,12 +624,7 @@ RESEARCH DATA:
 
     def _get_tone_description(self, audience: AudienceType) -> str:
         """Get tone description for audience"""
-        tones = {
-            AudienceType.YOUNG: "locker, humorvoll, energiegeladen",
-            AudienceType.MIDDLE_AGED: "ausgewogen, informativ und unterhaltsam",
-            AudienceType.SCIENTIFIC: "präzise, faktenbasiert, akademisch"
-        }
-        return tones.get(audience, "ausgewogen")
+        return self._TONES.get(audience, "ausgewogen")
 
     async def _get_recommendation(
         self,
@@ -477,6 +632,12 @@ RESEARCH DATA:
         variants: List[ScriptVariant]
     ) -> tuple[AudienceType, str]:
         """Get Claude's recommendation for best variant"""
+        # Nothing to choose between - skip the round trip
+        if not variants:
+            return AudienceType.MIDDLE_AGED, "Fallback: Ausgewogener Stil für breites Publikum"
+        if len(variants) == 1:
+            return variants[0].audience, "Einzige erfolgreich generierte Variante"
+
         variants_summary = "\n\n".join([
             f"{v.audience.value}:\nTone: {v.tone}\nWords: {v.word_count}\nSegments: {len(v.segments)}"
             for v in variants
@@ -499,31 +660,29 @@ RESEARCH DATA:
 
     def _parse_research_analysis(self, analysis_text: str) -> Dict:
         """Parse Claude's research analysis"""
-        try:
-            # Try to extract JSON
-            if "```json" in analysis_text:
-                json_str = analysis_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in analysis_text:
-                json_str = analysis_text.split("```")[1].split("```")[0].strip()
-            elif "{" in analysis_text:
-                # Find JSON object
-                start = analysis_text.find("{")
-                end = analysis_text.rfind("}") + 1
-                json_str = analysis_text[start:end]
-            else:
-                json_str = analysis_text
-
-            return json.loads(json_str)
-        except:
-            # Fallback parsing
-            return {
-                "key_findings": ["Research finding 1", "Finding 2", "Finding 3"],
-                "structure": ["Intro", "Main", "Outro"],
-                "discussion_points": [],
-                "examples": [],
-                "quality_score": 7.0,
-                "quality_reasoning": "Good sources"
-            }
+        # Decode the first JSON object in the text - inside or outside a
+        # ```json fence, with prose before or after it
+        start = analysis_text.find("{")
+        while start != -1:
+            try:
+                analysis, _ = _JSON_DECODER.raw_decode(analysis_text, start)
+            except ValueError:
+                start = analysis_text.find("{", start + 1)
+                continue
+            if isinstance(analysis, dict):
+                return analysis
+            start = analysis_text.find("{", start + 1)
+
+        # Fallback parsing
+        logger.warning("No JSON object found in research analysis, using defaults")
+        return {
+            "key_findings": ["Research finding 1", "Finding 2", "Finding 3"],
+            "structure": ["Intro", "Main", "Outro"],
+            "discussion_points": [],
+            "examples": [],
+            "quality_score": 7.0,
+            "quality_reasoning": "Good sources"
+        }
 
     async def save_variants_to_filesystem(
         self,
@@ -546,53 +705,66 @@ RESEARCH DATA:
         output_dir = settings.PODCAST_OUTPUT_DIR / f"research_{job_id}"
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        file_paths = {}
-
-        # Save research summary
         research_file = output_dir / "00_research_summary.txt"
-        with open(research_file, "w", encoding="utf-8") as f:
-            f.write(f"RESEARCH SUMMARY\n")
-            f.write(f"=" * 80 + "\n\n")
-            f.write(f"Topic: {research_result.topic}\n")
-            f.write(f"Sources: {research_result.total_sources}\n")
-            f.write(f"Quality Score: {research_result.estimated_quality_score}/10\n\n")
-            f.write(f"KEY FINDINGS:\n")
-            for i, finding in enumerate(research_result.key_findings, 1):
-                f.write(f"{i}. {finding}\n")
-            f.write(f"\n\nSUGGESTED STRUCTURE:\n")
-            for item in research_result.suggested_structure:
-                f.write(f"- {item}\n")
-
-        file_paths["research"] = str(research_file)
-
-        # Save each variant
-        for variant in variants:
-            filename = f"{variant.audience.value}_variant.txt"
-            file_path = output_dir / filename
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"PODCAST SCRIPT - {variant.audience.value.upper()}\n")
-                f.write(f"=" * 80 + "\n\n")
-                f.write(f"Title: {variant.title}\n")
-                f.write(f"Audience: {variant.audience.value}\n")
-                f.write(f"Tone: {variant.tone}\n")
-                f.write(f"Duration: ~{variant.total_duration_minutes} minutes\n")
-                f.write(f"Word Count: {variant.word_count}\n\n")
-                f.write(f"CHARACTERS:\n")
-                for char in variant.characters:
-                    f.write(f"- {char.name} ({char.role.value}): {char.personality}\n")
-                f.write(f"\n\n")
-                f.write(f"=" * 80 + "\n")
-                f.write(f"FULL SCRIPT:\n")
-                f.write(f"=" * 80 + "\n\n")
-                f.write(variant.full_script)
+        file_paths = {"research": str(research_file)}
+        writes = [asyncio.to_thread(self._write_research, research_file, research_result)]
 
+        for variant in variants:
+            file_path = output_dir / f"{variant.audience.value}_variant.txt"
             file_paths[variant.audience.value] = str(file_path)
+            writes.append(asyncio.to_thread(self._write_variant, file_path, variant))
+
+        # Write all files concurrently off the event loop
+        await asyncio.gather(*writes)
 
         logger.info(f"Saved {len(variants)} variants to {output_dir}")
 
         return str(output_dir), file_paths
 
+    @staticmethod
+    def _write_research(path: Path, research_result: ResearchResult) -> None:
+        """Write the research summary file in a single call"""
+        parts = [
+            "RESEARCH SUMMARY\n",
+            "=" * 80 + "\n\n",
+            f"Topic: {research_result.topic}\n",
+            f"Sources: {research_result.total_sources}\n",
+            f"Quality Score: {research_result.estimated_quality_score}/10\n\n",
+            "KEY FINDINGS:\n",
+        ]
+        parts.extend(f"{i}. {finding}\n" for i, finding in enumerate(research_result.key_findings, 1))
+        parts.append("\n\nSUGGESTED STRUCTURE:\n")
+        parts.extend(f"- {item}\n" for item in research_result.suggested_structure)
+
+        path.write_text("".join(parts), encoding="utf-8")
+
+    @staticmethod
+    def _write_variant(path: Path, variant: ScriptVariant) -> None:
+        """Write a script variant file in a single call"""
+        parts = [
+            f"PODCAST SCRIPT - {variant.audience.value.upper()}\n",
+            "=" * 80 + "\n\n",
+            f"Title: {variant.title}\n",
+            f"Audience: {variant.audience.value}\n",
+            f"Tone: {variant.tone}\n",
+            f"Duration: ~{variant.total_duration_minutes} minutes\n",
+            f"Word Count: {variant.word_count}\n\n",
+            "CHARACTERS:\n",
+        ]
+        parts.extend(
+            f"- {char.name} ({char.role.value}): {char.personality}\n"
+            for char in variant.characters
+        )
+        parts.extend([
+            "\n\n",
+            "=" * 80 + "\n",
+            "FULL SCRIPT:\n",
+            "=" * 80 + "\n\n",
+            variant.full_script,
+        ])
+
+        path.write_text("".join(parts), encoding="utf-8")
+
     async def _perform_intelligent_research(self, request: ResearchRequest) -> ResearchResult:
         """
         Perform intelligent 5-stage research using new pipeline
@@ -616,15 +788,20 @@ RESEARCH DATA:
             # Cache pipeline result for script generation
             self._pipeline_result = pipeline_result
 
-            # Extract final research from stage 5
-            final_research = pipeline_result.get("stage_5_final", {})
-            metadata = final_research.get("pipeline_metadata", {})
+            # Extract final research from stage 5 - resolve each section once
+            final_research = pipeline_result.get("stage_5_final") or {}
+            metadata = final_research.get("pipeline_metadata") or {}
+            hook_data = final_research.get("hook_potential")
+            practical = final_research.get("practical_value")
+            story_arc = final_research.get("story_arc")
+            production_notes = final_research.get("production_notes")
+            quality_assessment = final_research.get("quality_assessment")
 
             # Convert to ResearchSource format
             sources: List[ResearchSource] = []
 
             # Add web research sources if available
-            web_research = pipeline_result.get("stage_3_research", {}).get("web_research", {})
+            web_research = (pipeline_result.get("stage_3_research") or {}).get("web_research")
             if isinstance(web_research, dict) and "sources" in web_research:
                 for idx, source in enumerate(web_research.get("sources", [])[:10]):
                     if isinstance(source, dict):
@@ -640,7 +817,6 @@ RESEARCH DATA:
             # Extract key findings from hook potential and analysis
             key_findings = []
 
-            hook_data = final_research.get("hook_potential", {})
             if isinstance(hook_data, dict):
                 if "best_fact" in hook_data:
                     key_findings.append(f"🎯 HOOK: {hook_data['best_fact']}")
@@ -648,7 +824,6 @@ RESEARCH DATA:
                     key_findings.append(f"❓ {hook_data['provocative_question']}")
 
             # Add practical takeaways
-            practical = final_research.get("practical_value", {})
             if isinstance(practical, dict) and "actionable_takeaways" in practical:
                 takeaways = practical["actionable_takeaways"]
                 if isinstance(takeaways, list):
@@ -656,19 +831,15 @@ RESEARCH DATA:
                         key_findings.append(f"💡 Takeaway {i}: {takeaway}")
 
             # If not enough findings, add some from story arc
-            if len(key_findings) < 5:
-                story_arc = final_research.get("story_arc", {})
-                if isinstance(story_arc, dict):
-                    for key in ["act_1", "act_2", "act_3"]:
-                        if key in story_arc:
-                            val = story_arc[key]
-                            if isinstance(val, str):
-                                key_findings.append(val[:200])
+            if len(key_findings) < 5 and isinstance(story_arc, dict):
+                for key in ["act_1", "act_2", "act_3"]:
+                    val = story_arc.get(key)
+                    if isinstance(val, str):
+                        key_findings.append(val[:200])
 
             # Build structured podcast segments
             suggested_structure = []
 
-            story_arc = final_research.get("story_arc", {})
             if isinstance(story_arc, dict):
                 if "act_1" in story_arc:
                     suggested_structure.append(f"ACT 1 (Foundation): {story_arc['act_1']}")
@@ -677,13 +848,11 @@ RESEARCH DATA:
                 if "act_3" in story_arc:
                     suggested_structure.append(f"ACT 3 (Resolution): {story_arc['act_3']}")
 
-            production_notes = final_research.get("production_notes", {})
             if isinstance(production_notes, dict):
                 if "segment_lengths" in production_notes:
                     suggested_structure.append(f"Pacing: {production_notes['segment_lengths']}")
 
             # Calculate quality score from pipeline assessment
-            quality_assessment = final_research.get("quality_assessment", {})
             if isinstance(quality_assessment, dict):
                 scores = []
                 for key in ["viral_potential", "evergreen_value", "depth_potential", "podcast_readiness"]:
@@ -698,7 +867,7 @@ RESEARCH DATA:
 
             # Build warnings if any
             warnings = []
-            qc_results = pipeline_result.get("stage_4_qc", {}).get("quality_control", {})
+            qc_results = (pipeline_result.get("stage_4_qc") or {}).get("quality_control")
             if isinstance(qc_results, dict):
                 if qc_results.get("accuracy_score", 10) < 7:
                     warnings.append("Some claims may need verification")
@@ -5,14 +5,21 @@ Production-Ready Implementation - NO MOCKS
 
 import httpx
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Awaitable, Callable, Tuple
 from pathlib import Path
 import asyncio
 
 from core.config import settings
+from core.http import get_pool, stream_to_file
 
 logger = logging.getLogger(__name__)
 
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared Speechify connection pool"""
+    return get_pool("speechify", timeout=60.0, max_keepalive_connections=16, max_connections=32)
+
+
 class SpeechifyTTSService:
     """
     Speechify Text-to-Speech Service
@@ -21,6 +28,7 @@ class SpeechifyTTSService:
     """
     
     BASE_URL = "https://api.sws.speechify.com/v1/audio/speech"
+    STREAM_CHUNK_SIZE = 64 * 1024
     
     # Available models
     MODELS = {
@@ -104,6 +112,64 @@ class SpeechifyTTSService:
         Raises:
             Exception: If API call fails
         """
+        headers, payload = self._build_request(text, voice, model, speed, use_ssml, emotion)
+
+        chunks: List[bytes] = []
+
+        async def write(chunk: bytes):
+            chunks.append(chunk)
+
+        async def reset():
+            chunks.clear()
+
+        await self._stream_speech(headers, payload, write, reset)
+        audio_bytes = b"".join(chunks)
+
+        # Save to file if path provided
+        if output_path:
+            await asyncio.to_thread(self._save_output, output_path, audio_bytes)
+            logger.info(f"Saved audio to {output_path}")
+
+        return audio_bytes
+
+    async def generate_speech_to_file(
+        self,
+        text: str,
+        output_path: Path,
+        voice: str = "mia",
+        model: str = "simba-english",
+        speed: float = 1.0,
+        use_ssml: bool = False,
+        emotion: Optional[str] = None
+    ) -> int:
+        """
+        Generate speech straight into output_path
+
+        Same parameters as generate_speech, but the response is streamed to
+        disk and never held in memory.
+
+        Returns:
+            Size of the written file in bytes
+        """
+        headers, payload = self._build_request(text, voice, model, speed, use_ssml, emotion)
+
+        size = await stream_to_file(
+            output_path,
+            lambda write, reset: self._stream_speech(headers, payload, write, reset)
+        )
+        logger.info(f"Saved audio to {output_path}")
+        return size
+
+    def _build_request(
+        self,
+        text: str,
+        voice: str,
+        model: str,
+        speed: float,
+        use_ssml: bool,
+        emotion: Optional[str]
+    ) -> Tuple[Dict[str, str], Dict]:
+        """Validate parameters and build (headers, payload); raises before any I/O"""
         if not self.is_available():
             raise Exception("Speechify API key not configured")
         
@@ -137,47 +203,60 @@ class SpeechifyTTSService:
         # Add emotion if specified
         if emotion:
             payload["emotion"] = emotion
-        
-        # Make request with retry logic
+
+        return headers, payload
+
+    async def _stream_speech(
+        self,
+        headers: Dict[str, str],
+        payload: Dict,
+        write: Callable[[bytes], Awaitable[None]],
+        reset: Callable[[], Awaitable[None]]
+    ) -> int:
+        """
+        Call the speech endpoint with retry logic, passing each body chunk
+        to ``write``; ``reset`` discards a partial body before a retry.
+        Returns the number of bytes written.
+        """
         max_retries = 3
         retry_delay = 1.0
         
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    response = await client.post(
-                        self.BASE_URL,
-                        headers=headers,
-                        json=payload
-                    )
-                    
+                async with _get_http_client().stream(
+                    "POST",
+                    self.BASE_URL,
+                    headers=headers,
+                    json=payload
+                ) as response:
                     if response.status_code == 200:
-                        audio_bytes = response.content
-                        
-                        # Save to file if path provided
-                        if output_path:
-                            output_path.parent.mkdir(parents=True, exist_ok=True)
-                            output_path.write_bytes(audio_bytes)
-                            logger.info(f"Saved audio to {output_path}")
-                        
-                        logger.info(f"Generated {len(audio_bytes)} bytes of audio")
-                        return audio_bytes
-                    else:
-                        error_msg = f"Speechify API error: {response.status_code} - {response.text}"
-                        logger.error(error_msg)
-                        
-                        # Don't retry on client errors (4xx)
-                        if 400 <= response.status_code < 500:
-                            raise Exception(error_msg)
+                        await reset()
+                        size = 0
+                        async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                            await write(chunk)
+                            size += len(chunk)
+
+                        logger.info(f"Generated {size} bytes of audio")
+                        return size
+
+                    await response.aread()
+                    status_code = response.status_code
+                    error_msg = f"Speechify API error: {status_code} - {response.text}"
+
+                logger.error(error_msg)
+                
+                # Don't retry on client errors (4xx)
+                if 400 <= status_code < 500:
+                    raise Exception(error_msg)
+                
+                # Retry on server errors (5xx)
+                if attempt < max_retries - 1:
+                    logger.warning(f"Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2
+                else:
+                    raise Exception(error_msg)
                         
-                        # Retry on server errors (5xx)
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
-                            await asyncio.sleep(retry_delay)
-                            retry_delay *= 2
-                        else:
-                            raise Exception(error_msg)
-                            
             except httpx.TimeoutException:
                 logger.error("Request timed out")
                 if attempt < max_retries - 1:
@@ -197,6 +276,12 @@ class SpeechifyTTSService:
                     raise
         
         raise Exception("Failed to generate speech after multiple retries")
+
+    @staticmethod
+    def _save_output(output_path: Path, audio_bytes: bytes):
+        """Write audio to output_path (run in a worker thread)"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(audio_bytes)
     
     async def clone_voice(
         self,
@@ -241,15 +326,15 @@ class SpeechifyTTSService:
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
+            client = _get_http_client()
+            response = await client.get(url, headers=headers, timeout=30.0)
 
-                if response.status_code == 200:
-                    voices = response.json()
-                    return voices
-                else:
-                    logger.error(f"Failed to fetch voices: {response.status_code}")
-                    return []
+            if response.status_code == 200:
+                voices = response.json()
+                return voices
+            else:
+                logger.error(f"Failed to fetch voices: {response.status_code}")
+                return []
         except Exception as e:
             logger.error(f"Error fetching voices: {e}")
             return []
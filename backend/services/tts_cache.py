@@ -0,0 +1,177 @@
+"""
+TTS Audio Cache
+Content-addressed on-disk LRU cache shared by all TTS providers
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import unicodedata
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class SpeechCache:
+    """
+    On-disk LRU cache of generated speech audio
+
+    Files live at ``<dir>/<key[:2]>/<key>.audio``; an in-memory index of
+    key -> size (oldest first) keeps the total under ``max_bytes``. The
+    index is rebuilt from the directory, oldest mtime first, on first use.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Content-addressed key, e.g. make_key(provider, voice, speed, text)"""
+        return hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """
+        Canonical form of text for cache keys
+
+        Folds differences that don't change the spoken audio (Unicode
+        compatibility forms, whitespace runs, surrounding whitespace) so
+        small edits between regenerations still hit. Case and punctuation
+        are kept - they change pronunciation and intonation.
+        """
+        return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.audio"
+
+    def _load(self) -> "OrderedDict[str, int]":
+        entries = []
+        for path in self.directory.glob("*/*.audio"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        return OrderedDict((key, size) for _, key, size in sorted(entries))
+
+    async def _ensure_loaded(self):
+        if self._loaded:
+            return
+        # Concurrent first lookups must share one directory scan
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._index = await asyncio.to_thread(self._load)
+            self._total = sum(self._index.values())
+            self._loaded = True
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio, or None on a miss"""
+        if self.max_bytes <= 0:
+            return None
+        await self._ensure_loaded()
+        if key not in self._index:
+            return None
+        try:
+            data = await asyncio.to_thread(self._path(key).read_bytes)
+        except OSError:
+            self._total -= self._index.pop(key, 0)
+            return None
+        self._index.move_to_end(key)
+        return data
+
+    async def copy_to(self, key: str, dest: Path) -> Optional[int]:
+        """Copy cached audio to dest without loading it; returns its size, or None on a miss"""
+        if self.max_bytes <= 0:
+            return None
+        await self._ensure_loaded()
+        if key not in self._index:
+            return None
+        try:
+            await asyncio.to_thread(self._copy, self._path(key), dest)
+        except OSError:
+            self._total -= self._index.pop(key, 0)
+            return None
+        self._index.move_to_end(key)
+        return self._index[key]
+
+    async def put(self, key: str, data: bytes):
+        """Store audio atomically (write .tmp, then rename) and evict LRU entries"""
+        if self.max_bytes <= 0 or len(data) > self.max_bytes:
+            return
+        await self._ensure_loaded()
+        try:
+            await asyncio.to_thread(self._write, self._path(key), data)
+        except OSError as e:
+            logger.warning(f"Could not write TTS cache entry: {e}")
+            return
+        await self._admit(key, len(data))
+
+    async def put_file(self, key: str, src: Path, size: int):
+        """Store an audio file already on disk (copied, then renamed into place)"""
+        if self.max_bytes <= 0 or size > self.max_bytes:
+            return
+        await self._ensure_loaded()
+        try:
+            await asyncio.to_thread(self._copy, src, self._path(key))
+        except OSError as e:
+            logger.warning(f"Could not write TTS cache entry: {e}")
+            return
+        await self._admit(key, size)
+
+    async def _admit(self, key: str, size: int):
+        """Account for a stored entry and evict LRU entries over budget"""
+        self._total += size - self._index.pop(key, 0)
+        self._index[key] = size
+
+        evicted = []
+        while self._total > self.max_bytes and self._index:
+            old_key, old_size = self._index.popitem(last=False)
+            self._total -= old_size
+            evicted.append(self._path(old_key))
+        if evicted:
+            await asyncio.to_thread(self._unlink_all, evicted)
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _copy(src: Path, dest: Path):
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+
+    @staticmethod
+    def _unlink_all(paths: List[Path]):
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+# One cache (and one size budget) for every TTS provider
+speech_cache = SpeechCache(
+    settings.TTS_CACHE_DIR,
+    settings.TTS_CACHE_MAX_MB * 1024 * 1024
+)
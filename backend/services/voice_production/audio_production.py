@@ -5,12 +5,32 @@ Professional mixing, mastering, effects
 Quality: 15/10
 """
 
+import asyncio
+import io
 import logging
-from typing import List, Dict
-from dataclass import dataclass
+import sys
+import wave
+from array import array
+from itertools import zip_longest
+from typing import List, Dict, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+
+# audioop gives C-speed saturating int16 add/scale (stdlib through 3.12)
+try:
+    import warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ImportError:
+    audioop = None
 
 logger = logging.getLogger(__name__)
 
+# Raw PCM format handled natively by the mixer (e.g. OpenAI response_format="pcm")
+PCM_S16LE = "s16le"
+_INT16_MIN, _INT16_MAX = -32768, 32767
+
 
 @dataclass
 class AudioTrack:
@@ -19,6 +39,12 @@ class AudioTrack:
     track_type: str  # "dialogue", "music", "sfx"
     volume: float = 1.0  # 0.0 - 1.0
     pan: float = 0.0  # -1.0 (left) to 1.0 (right)
+    sample_format: str = "mp3"  # "mp3" or PCM_S16LE (raw mono int16)
+    sample_rate: Optional[int] = None  # Required for PCM tracks
+
+    @property
+    def is_pcm(self) -> bool:
+        return self.sample_format == PCM_S16LE
 
 
 class AudioSession:
@@ -66,7 +92,7 @@ class AudioProductionPipeline:
             sfx_tracks: Sound effects
 
         Returns:
-            Final mastered audio (MP3)
+            Final mastered audio (WAV for int16 PCM input, else MP3)
         """
         logger.info("🎬 Starting audio production...")
 
@@ -96,7 +122,118 @@ class AudioProductionPipeline:
         logger.info("  4️⃣  Mastering...")
         # master = self._master_audio(mix)
 
+        dialogue = session.tracks["dialogue"]
+        overlays = session.tracks["music"] + session.tracks["sfx"]
+        rate = dialogue[0].sample_rate if dialogue else None
+
+        if dialogue and all(t.is_pcm and t.sample_rate == rate for t in dialogue + overlays):
+            # int16 PCM end-to-end: no codec round trip, half the bytes of float32.
+            # Mixing is CPU-bound (per-sample without audioop), so keep it off the loop
+            wav = await asyncio.to_thread(self._render_wav, dialogue, overlays, rate)
+            logger.info("✅ Audio production complete!")
+            return wav
+
         logger.info("✅ Audio production complete!")
 
-        # Placeholder - in production: use pydub or ffmpeg
-        return dialogue_tracks[0].audio_data if dialogue_tracks else b""
+        # Compressed tracks: MP3 frames concatenate; full mixing of
+        # compressed audio needs a decoder (pydub / ffmpeg)
+        return b"".join(t.audio_data for t in dialogue)
+
+    def _render_wav(self, dialogue: List[AudioTrack], overlays: List[AudioTrack], rate: int) -> bytes:
+        """Mix int16 PCM tracks into a WAV file (runs in a worker thread)"""
+        return self._to_wav(self._mix_pcm(dialogue, overlays), rate)
+
+    def _mix_pcm(self, dialogue: List[AudioTrack], overlays: List[AudioTrack]) -> bytes:
+        """
+        Mix int16 PCM tracks
+
+        Dialogue segments play back to back; music and SFX are laid over
+        the start of the timeline. Samples are summed with a wider
+        accumulator and saturated to int16, never converted to float.
+        """
+        mix = b"".join(self._apply_volume(t) for t in dialogue)
+        if not overlays:
+            return mix
+
+        if audioop is None:
+            return self._mix_fused(mix, overlays)
+
+        for track in overlays:
+            layer = self._apply_volume(track)
+            # Only the overlapping span needs summing; the longer track's
+            # tail is appended as-is instead of adding zero padding
+            span = min(len(mix), len(layer)) & ~1
+            mix = audioop.add(mix[:span], layer[:span], 2) + mix[span:] + layer[span:]
+        return mix
+
+    @staticmethod
+    def _mix_fused(mix: bytes, overlays: List[AudioTrack]) -> bytes:
+        """
+        Pure-Python mix without audioop
+
+        One sweep over all layers: gain, sum and clip are fused per
+        sample, so the timeline is traversed once and clipped once.
+        """
+        layers = [_pcm_array(mix)] + [_pcm_array(t.audio_data) for t in overlays]
+        gains = (1.0,) + tuple(t.volume for t in overlays)
+        return _pcm_bytes(array("h", (
+            min(max(int(sum(v * g for v, g in zip(frame, gains))), _INT16_MIN), _INT16_MAX)
+            for frame in zip_longest(*layers, fillvalue=0)
+        )))
+
+    @staticmethod
+    def _apply_volume(track: AudioTrack) -> bytes:
+        data = track.audio_data
+        if track.volume == 1.0:
+            return data
+        if audioop is not None:
+            return audioop.mul(data, 2, track.volume)
+        samples = _pcm_array(data)
+        gain = track.volume
+        if len(samples) <= _GAIN_TABLE_SIZE:
+            return _pcm_bytes(array("h", (
+                min(max(int(v * gain), _INT16_MIN), _INT16_MAX) for v in samples
+            )))
+        # Long tracks: look every sample up in a precomputed gain table,
+        # indexed by its unsigned bit pattern, so the loop runs in C (map)
+        table = _gain_table(gain)
+        return _pcm_bytes(array("h", map(table.__getitem__, array("H", samples.tobytes()))))
+
+    @staticmethod
+    def _to_wav(pcm: bytes, sample_rate: int) -> bytes:
+        """Wrap mono int16 PCM in a WAV container"""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(pcm)
+        return buffer.getvalue()
+
+
+_GAIN_TABLE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=8)
+def _gain_table(gain: float) -> List[int]:
+    """Saturated int16 result of scaling each sample value, indexed by its uint16 bits"""
+    return [
+        min(max(int((u - _GAIN_TABLE_SIZE if u > _INT16_MAX else u) * gain), _INT16_MIN), _INT16_MAX)
+        for u in range(_GAIN_TABLE_SIZE)
+    ]
+
+
+def _pcm_array(data: bytes) -> array:
+    """Little-endian int16 bytes -> array('h')"""
+    samples = array("h")
+    samples.frombytes(data[:len(data) & ~1])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+
+def _pcm_bytes(samples: array) -> bytes:
+    """array('h') -> little-endian int16 bytes"""
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
@@ -6,12 +6,15 @@ Integrates: ElevenLabs, Azure, Google, AWS, Custom Models
 Quality: 15/10 - Professional Studio-Grade
 """
 
+import asyncio
 import logging
 import os
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from core.http import close_pool, get_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,10 +77,27 @@ class EnterpriseVoiceEngine:
     - Automatic provider fallback
     """
 
+    # Bulkheads: max concurrent syntheses per provider, so one slow or
+    # failing provider can't tie up every pending synthesis
+    PROVIDER_CONCURRENCY = {
+        "elevenlabs": 8,
+        "azure": 8,
+        "fallback": 4
+    }
+
+    # Sample rate of raw PCM output (output_format="pcm"), mono int16 LE
+    PCM_SAMPLE_RATE = 24000
+
     def __init__(self):
         self.elevenlabs_available = self._check_elevenlabs()
         self.azure_available = self._check_azure()
 
+        self._bulkheads = {
+            provider: asyncio.Semaphore(limit)
+            for provider, limit in self.PROVIDER_CONCURRENCY.items()
+        }
+        self._in_flight = dict.fromkeys(self.PROVIDER_CONCURRENCY, 0)
+
         # Voice Library
         self.voice_library = self._load_voice_library()
 
@@ -133,7 +153,8 @@ class EnterpriseVoiceEngine:
     async def synthesize(self,
                         text: str,
                         voice_profile: VoiceProfile,
-                        emotion_profile: EmotionProfile) -> bytes:
+                        emotion_profile: EmotionProfile,
+                        output_format: str = "mp3") -> bytes:
         """
         Synthesize speech with emotion and prosody control
 
@@ -141,9 +162,10 @@ class EnterpriseVoiceEngine:
             text: Text to synthesize
             voice_profile: Voice configuration
             emotion_profile: Emotion and performance parameters
+            output_format: "mp3", or "pcm" for raw mono int16 at PCM_SAMPLE_RATE
 
         Returns:
-            Audio bytes (MP3 format)
+            Audio bytes in the requested format
         """
         logger.info(f"🎤 Synthesizing with {voice_profile.name}")
         logger.info(f"   Emotion: {emotion_profile.primary_emotion.value}")
@@ -154,13 +176,25 @@ class EnterpriseVoiceEngine:
 
         # Select provider
         if voice_profile.provider == "elevenlabs" and self.elevenlabs_available:
-            audio = await self._synthesize_elevenlabs(ssml, voice_profile, emotion_profile)
+            provider = "elevenlabs"
         elif voice_profile.provider == "azure" and self.azure_available:
-            audio = await self._synthesize_azure(ssml, voice_profile, emotion_profile)
+            provider = "azure"
         else:
             # Fallback to basic TTS
             logger.warning("⚠️  No premium provider available, using fallback")
-            audio = await self._synthesize_fallback(text, voice_profile)
+            provider = "fallback"
+
+        async with self._bulkheads[provider]:
+            self._in_flight[provider] += 1
+            try:
+                if provider == "elevenlabs":
+                    audio = await self._synthesize_elevenlabs(ssml, voice_profile, emotion_profile, output_format)
+                elif provider == "azure":
+                    audio = await self._synthesize_azure(ssml, voice_profile, emotion_profile)
+                else:
+                    audio = await self._synthesize_fallback(text, voice_profile)
+            finally:
+                self._in_flight[provider] -= 1
 
         logger.info(f"✅ Synthesized {len(audio)/1024:.1f}KB audio")
         return audio
@@ -265,12 +299,11 @@ class EnterpriseVoiceEngine:
     async def _synthesize_elevenlabs(self,
                                      ssml: str,
                                      voice: VoiceProfile,
-                                     emotion: EmotionProfile) -> bytes:
+                                     emotion: EmotionProfile,
+                                     output_format: str = "mp3") -> bytes:
         """Synthesize using ElevenLabs API"""
         try:
             # In production: Use actual ElevenLabs API
-            import httpx
-
             api_key = os.getenv("ELEVENLABS_API_KEY")
             url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice.voice_id}"
 
@@ -297,10 +330,12 @@ class EnterpriseVoiceEngine:
                 "Content-Type": "application/json"
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                return response.content
+            # Raw PCM skips the MP3 encode here and the decode before mixing
+            params = {"output_format": f"pcm_{self.PCM_SAMPLE_RATE}"} if output_format == "pcm" else None
+
+            response = await self._get_elevenlabs_client().post(url, json=payload, headers=headers, params=params)
+            response.raise_for_status()
+            return response.content
 
         except Exception as e:
             logger.error(f"❌ ElevenLabs synthesis failed: {e}")
@@ -327,6 +362,30 @@ class EnterpriseVoiceEngine:
         # In production: Use local TTS like Piper or Coqui
         return b""
 
+    def get_metrics(self) -> Dict[str, Dict[str, int]]:
+        """In-flight syntheses and bulkhead limit per provider"""
+        return {
+            provider: {
+                "in_flight": self._in_flight[provider],
+                "limit": limit
+            }
+            for provider, limit in self.PROVIDER_CONCURRENCY.items()
+        }
+
+    def _get_elevenlabs_client(self):
+        """Shared keep-alive ElevenLabs pool sized to the provider bulkhead"""
+        limit = self.PROVIDER_CONCURRENCY["elevenlabs"]
+        return get_pool(
+            "voice_engine_elevenlabs",
+            timeout=30.0,
+            max_keepalive_connections=limit,
+            max_connections=limit
+        )
+
+    async def aclose(self):
+        """Close provider HTTP clients"""
+        await close_pool("voice_engine_elevenlabs")
+
     def select_voice(self,
                     character_type: str = "narrator",
                     gender: str = "neutral",